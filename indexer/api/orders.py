@@ -2,13 +2,21 @@
 Orders API routes
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
+from cachetools import LRUCache
 
 router = APIRouter()
 
+# Orders in a terminal status never change again, so their serialized
+# response bodies can be reused verbatim — repeat reads of historical
+# orders skip the DB and Pydantic entirely
+_TERMINAL_STATUSES = frozenset({4, 6, 7, 8})
+_order_response_cache = LRUCache(maxsize=10_000)
+
 
 class OrderResponse(BaseModel):
     id: int
@@ -22,8 +30,7 @@ class OrderResponse(BaseModel):
     deadline: datetime
     solver: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OrderListResponse(BaseModel):
@@ -33,17 +40,34 @@ class OrderListResponse(BaseModel):
     limit: int
 
 
-# Import db from main module
-from main import db
+from deps import get_db
+from models import Database
+
+
+def _order_payload(order) -> dict:
+    """Response dict for an Order; explicit fields since the model is slotted"""
+    return OrderResponse.model_construct(
+        id=order.id,
+        issuer=order.issuer,
+        problem_hash=order.problem_hash,
+        problem_type=order.problem_type,
+        time_tier=order.time_tier,
+        status=order.status,
+        reward=order.reward,
+        created_at=order.created_at,
+        deadline=order.deadline,
+        solver=order.solver
+    ).model_dump(mode='json', exclude_unset=True)
 
 
-@router.get("/orders", response_model=OrderListResponse)
+@router.get("/orders")
 async def list_orders(
     status: Optional[int] = Query(None, description="Filter by status (0=Open, 1=Accepted, etc.)"),
     issuer: Optional[str] = Query(None, description="Filter by issuer address"),
     solver: Optional[str] = Query(None, description="Filter by solver address"),
     page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    db: Database = Depends(get_db)
 ):
     """
     List orders with optional filters.
@@ -60,89 +84,95 @@ async def list_orders(
     - 8: Rejected
     """
     offset = (page - 1) * limit
-    
-    orders = await db.get_orders(
+
+    orders, total = await db.get_orders_with_total(
         status=status,
         issuer=issuer,
         solver=solver,
         limit=limit,
         offset=offset
     )
-    
-    total = await db.get_order_count(status=status)
-    
-    return OrderListResponse(
-        orders=[OrderResponse(**o.__dict__) for o in orders],
-        total=total,
-        page=page,
-        limit=limit
-    )
+
+    return ORJSONResponse({
+        "orders": [_order_payload(o) for o in orders],
+        "total": total,
+        "page": page,
+        "limit": limit
+    })
 
 
-@router.get("/orders/{order_id}", response_model=OrderResponse)
-async def get_order(order_id: int):
+@router.get("/orders/{order_id}")
+async def get_order(order_id: int, db: Database = Depends(get_db)):
     """Get a specific order by ID"""
+    body = _order_response_cache.get(order_id)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
     order = await db.get_order(order_id)
-    
+
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-    
-    return OrderResponse(**order.__dict__)
+
+    response = ORJSONResponse(_order_payload(order))
+    if order.status in _TERMINAL_STATUSES:
+        _order_response_cache[order_id] = response.body
+    return response
 
 
-@router.get("/orders/open", response_model=OrderListResponse)
+@router.get("/orders/open")
 async def list_open_orders(
     page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    db: Database = Depends(get_db)
 ):
     """List all open orders (shortcut for status=0)"""
     offset = (page - 1) * limit
     
-    orders = await db.get_orders(status=0, limit=limit, offset=offset)
-    total = await db.get_order_count(status=0)
-    
-    return OrderListResponse(
-        orders=[OrderResponse(**o.__dict__) for o in orders],
-        total=total,
-        page=page,
-        limit=limit
-    )
+    orders, total = await db.get_orders_with_total(status=0, limit=limit, offset=offset)
+
+    return ORJSONResponse({
+        "orders": [_order_payload(o) for o in orders],
+        "total": total,
+        "page": page,
+        "limit": limit
+    })
 
 
-@router.get("/orders/by-issuer/{address}", response_model=OrderListResponse)
+@router.get("/orders/by-issuer/{address}")
 async def get_orders_by_issuer(
     address: str,
     page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    db: Database = Depends(get_db)
 ):
     """Get all orders posted by a specific address"""
     offset = (page - 1) * limit
     
-    orders = await db.get_orders(issuer=address, limit=limit, offset=offset)
-    # Total would need a specific count query
-    
-    return OrderListResponse(
-        orders=[OrderResponse(**o.__dict__) for o in orders],
-        total=len(orders),
-        page=page,
-        limit=limit
-    )
+    orders, total = await db.get_orders_with_total(issuer=address, limit=limit, offset=offset)
+
+    return ORJSONResponse({
+        "orders": [_order_payload(o) for o in orders],
+        "total": total,
+        "page": page,
+        "limit": limit
+    })
 
 
-@router.get("/orders/by-solver/{address}", response_model=OrderListResponse)
+@router.get("/orders/by-solver/{address}")
 async def get_orders_by_solver(
     address: str,
     page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    db: Database = Depends(get_db)
 ):
     """Get all orders being solved by a specific address"""
     offset = (page - 1) * limit
     
-    orders = await db.get_orders(solver=address, limit=limit, offset=offset)
-    
-    return OrderListResponse(
-        orders=[OrderResponse(**o.__dict__) for o in orders],
-        total=len(orders),
-        page=page,
-        limit=limit
-    )
+    orders, total = await db.get_orders_with_total(solver=address, limit=limit, offset=offset)
+
+    return ORJSONResponse({
+        "orders": [_order_payload(o) for o in orders],
+        "total": total,
+        "page": page,
+        "limit": limit
+    })
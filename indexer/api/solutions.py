@@ -2,13 +2,19 @@
 Solutions API routes
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
+from cachetools import LRUCache
 
 router = APIRouter()
 
+# Revealed solutions are immutable; cache their serialized bodies so the
+# long tail of historical reads never touches the DB
+_solution_response_cache = LRUCache(maxsize=10_000)
+
 
 class SolutionResponse(BaseModel):
     order_id: int
@@ -19,8 +25,7 @@ class SolutionResponse(BaseModel):
     reveal_time: Optional[datetime] = None
     is_revealed: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChallengeResponse(BaseModel):
@@ -32,31 +37,63 @@ class ChallengeResponse(BaseModel):
     resolved: bool = False
     challenger_won: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+from deps import get_db
+from models import Database
+
+
+def _solution_payload(solution) -> dict:
+    """Response dict for a Solution; explicit fields since the model is slotted"""
+    return SolutionResponse.model_construct(
+        order_id=solution.order_id,
+        solver=solution.solver,
+        commit_hash=solution.commit_hash,
+        solution=solution.solution,
+        commit_time=solution.commit_time,
+        reveal_time=solution.reveal_time,
+        is_revealed=solution.is_revealed
+    ).model_dump(mode='json', exclude_unset=True)
 
 
-# Import db from main module
-from main import db
+def _challenge_payload(challenge) -> dict:
+    """Response dict for a Challenge; explicit fields since the model is slotted"""
+    return ChallengeResponse.model_construct(
+        order_id=challenge.order_id,
+        challenger=challenge.challenger,
+        stake=challenge.stake,
+        reason=challenge.reason,
+        challenge_time=challenge.challenge_time,
+        resolved=challenge.resolved,
+        challenger_won=challenge.challenger_won
+    ).model_dump(mode='json', exclude_unset=True)
 
 
-@router.get("/solutions/{order_id}", response_model=SolutionResponse)
-async def get_solution(order_id: int):
+@router.get("/solutions/{order_id}")
+async def get_solution(order_id: int, db: Database = Depends(get_db)):
     """Get solution for an order"""
+    body = _solution_response_cache.get(order_id)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
     solution = await db.get_solution(order_id)
-    
+
     if not solution:
         raise HTTPException(status_code=404, detail="Solution not found")
-    
-    return SolutionResponse(**solution.__dict__)
+
+    response = ORJSONResponse(_solution_payload(solution))
+    if solution.is_revealed:
+        _solution_response_cache[order_id] = response.body
+    return response
 
 
-@router.get("/challenges/{order_id}", response_model=ChallengeResponse)
-async def get_challenge(order_id: int):
+@router.get("/challenges/{order_id}")
+async def get_challenge(order_id: int, db: Database = Depends(get_db)):
     """Get challenge for an order"""
     challenge = await db.get_challenge(order_id)
-    
+
     if not challenge:
         raise HTTPException(status_code=404, detail="Challenge not found")
-    
-    return ChallengeResponse(**challenge.__dict__)
+
+    return ORJSONResponse(_challenge_payload(challenge))
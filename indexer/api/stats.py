@@ -2,11 +2,21 @@
 Statistics API routes
 """
 
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from cachetools import TTLCache
 
 router = APIRouter()
 
+# Stats are stale-tolerant aggregates hit by dashboards on a tight poll;
+# a short TTL absorbs almost all of the DB traffic. The lock prevents a
+# stampede of aggregate queries when the entry expires.
+_stats_cache = TTLCache(maxsize=1, ttl=5)
+_stats_lock = asyncio.Lock()
+
 
 class StatsResponse(BaseModel):
     total_orders: int
@@ -16,26 +26,40 @@ class StatsResponse(BaseModel):
     success_rate: float = 0.0
 
 
-# Import db from main module
-from main import db
-
-
-@router.get("/stats", response_model=StatsResponse)
-async def get_stats():
-    """Get protocol statistics"""
-    stats = await db.get_stats()
-    
-    # Calculate success rate
-    success_rate = 0.0
-    total = stats.get("total_orders", 0)
-    completed = stats.get("completed_orders", 0)
-    if total > 0:
-        success_rate = (completed / total) * 100
-    
-    return StatsResponse(
-        total_orders=stats.get("total_orders", 0),
-        open_orders=stats.get("open_orders", 0),
-        completed_orders=stats.get("completed_orders", 0),
-        total_challenges=stats.get("total_challenges", 0),
-        success_rate=round(success_rate, 2)
-    )
+from deps import get_db
+from models import Database
+
+
+@router.get("/stats")
+async def get_stats(db: Database = Depends(get_db)):
+    """Get protocol statistics (cached for a few seconds)"""
+    try:
+        return ORJSONResponse(_stats_cache["stats"])
+    except KeyError:
+        pass
+
+    async with _stats_lock:
+        # Double-check: another request may have refilled while we waited
+        try:
+            return ORJSONResponse(_stats_cache["stats"])
+        except KeyError:
+            pass
+
+        stats = await db.get_stats()
+
+        # Calculate success rate
+        success_rate = 0.0
+        total = stats.get("total_orders", 0)
+        completed = stats.get("completed_orders", 0)
+        if total > 0:
+            success_rate = (completed / total) * 100
+
+        payload = {
+            "total_orders": stats.get("total_orders", 0),
+            "open_orders": stats.get("open_orders", 0),
+            "completed_orders": stats.get("completed_orders", 0),
+            "total_challenges": stats.get("total_challenges", 0),
+            "success_rate": round(success_rate, 2)
+        }
+        _stats_cache["stats"] = payload
+        return ORJSONResponse(payload)
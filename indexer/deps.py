@@ -0,0 +1,12 @@
+"""
+Shared FastAPI dependencies for Ominis Indexer
+"""
+
+from fastapi import Request
+
+from models import Database
+
+
+async def get_db(request: Request) -> Database:
+    """Get the Database instance from application state"""
+    return request.app.state.db
@@ -4,11 +4,14 @@ Blockchain event listener for Ominis Indexer
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable, Optional
 
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
+from web3._utils.events import get_event_data
+from eth_utils import event_abi_to_log_topic
 
 from models import Database, Order, Solution, Challenge
 
@@ -93,7 +96,11 @@ class EventListener:
     """
     Listens to blockchain events and indexes them to database.
     """
-    
+
+    # Bounds for the adaptive historical-sync chunk size
+    MIN_CHUNK_SIZE = 100
+    MAX_CHUNK_SIZE = 50_000
+
     def __init__(
         self,
         rpc_url: str,
@@ -115,15 +122,57 @@ class EventListener:
             address=self.core_contract,
             abi=CORE_EVENTS_ABI
         )
-        
+
+        # Precompile topic hashes and decoding ABIs once; the high-level
+        # contract.events.X.get_logs path re-assembles the filter dict and
+        # ABI lookup on every call
+        self._event_abis = {
+            abi['name']: abi for abi in CORE_EVENTS_ABI if abi.get('type') == 'event'
+        }
+        self._topic0 = {
+            name: '0x' + event_abi_to_log_topic(abi).hex().replace('0x', '')
+            for name, abi in self._event_abis.items()
+        }
+        self._abi_by_topic = {
+            topic: self._event_abis[name] for name, topic in self._topic0.items()
+        }
+        self._name_by_topic = {
+            topic: name for name, topic in self._topic0.items()
+        }
+        # Event types the indexer actually handles per block range
+        self._indexed_events = (
+            'ProblemPosted', 'OrderAccepted', 'SolutionCommitted',
+            'SolutionRevealed', 'ChallengeSubmitted'
+        )
+        self._indexed_topics = [self._topic0[name] for name in self._indexed_events]
+
         self.running = False
         self.last_processed_block = start_block
-        
+
+        # Historical sync chunk size, adapted to event density and provider
+        # speed (AIMD: double on fast sparse ranges, halve on rejections)
+        self._chunk_size = 1000
+
+        # Sync web3 calls run here so RPC latency never blocks the event
+        # loop (and with it the API and websocket traffic)
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
+        # Block timestamp cache (block number -> unix timestamp) so events
+        # sharing a block don't each trigger an eth_getBlockByNumber call
+        self._block_timestamps = {}
+        self._block_timestamp_cache_size = 4096
+
     async def start(self):
         """Start listening for events"""
         self.running = True
-        logger.info(f"Starting event listener from block {self.start_block}")
-        
+
+        # Resume from the persisted cursor so a restart re-scans only the
+        # blocks mined since the previous shutdown
+        resume_block = await self.database.get_last_processed_block()
+        if resume_block is not None:
+            self.last_processed_block = max(self.start_block, resume_block)
+        logger.info(f"Starting event listener from block {self.last_processed_block}")
+
         # First, catch up on historical events
         await self._sync_historical_events()
         
@@ -133,119 +182,271 @@ class EventListener:
     async def stop(self):
         """Stop the listener"""
         self.running = False
+        self._executor.shutdown(wait=False)
         logger.info("Event listener stopped")
-    
+
+    async def _get_block_number(self) -> int:
+        """Fetch the current block number without blocking the event loop"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: self.w3.eth.block_number
+        )
+
     async def _sync_historical_events(self):
         """Sync historical events from start_block to current"""
-        current_block = self.w3.eth.block_number
+        current_block = await self._get_block_number()
         
         if self.last_processed_block >= current_block:
             return
         
         logger.info(f"Syncing historical events from {self.last_processed_block} to {current_block}")
-        
+
         # Process in chunks
-        chunk_size = 1000
         from_block = self.last_processed_block
-        
+
         while from_block < current_block and self.running:
-            to_block = min(from_block + chunk_size, current_block)
-            
-            await self._process_block_range(from_block, to_block)
-            
+            to_block = min(from_block + self._chunk_size, current_block)
+
+            started = asyncio.get_event_loop().time()
+            try:
+                event_count = await self._process_block_range(from_block, to_block)
+            except Exception as e:
+                if self._is_too_many_results_error(e) and self._chunk_size > self.MIN_CHUNK_SIZE:
+                    self._chunk_size = max(self._chunk_size // 2, self.MIN_CHUNK_SIZE)
+                    logger.warning(
+                        f"Provider rejected range {from_block}-{to_block}, "
+                        f"retrying with chunk size {self._chunk_size}"
+                    )
+                    continue
+                logger.error(f"Error processing blocks {from_block}-{to_block}: {e}")
+                event_count = 0
+            elapsed = asyncio.get_event_loop().time() - started
+
             from_block = to_block + 1
             self.last_processed_block = to_block
-            
-            # Small delay to not overwhelm RPC
-            await asyncio.sleep(0.1)
-        
+
+            # Grow through sparse ranges the provider answered quickly;
+            # dense or slow ranges keep the current size
+            if elapsed < 0.5 and event_count < 10:
+                self._chunk_size = min(self._chunk_size * 2, self.MAX_CHUNK_SIZE)
+
+            # Small delay to not overwhelm RPC (skipped when it was slow anyway)
+            await asyncio.sleep(max(0.0, 0.1 - elapsed))
+
         logger.info(f"Historical sync complete. At block {self.last_processed_block}")
-    
+
+    @staticmethod
+    def _is_too_many_results_error(error: Exception) -> bool:
+        """Detect the provider's 'query returned more than N results' rejection"""
+        message = str(error).lower()
+        return '-32005' in message or 'more than' in message or 'too many' in message
+
+    @staticmethod
+    def _is_unsupported_method_error(error: Exception) -> bool:
+        """Detect providers that don't implement filter RPCs"""
+        message = str(error).lower()
+        return '-32601' in message or 'method not found' in message or 'not supported' in message
+
+    async def _install_log_filter(self):
+        """Install a server-side log filter, or None if the provider lacks support"""
+        loop = asyncio.get_event_loop()
+        try:
+            log_filter = await loop.run_in_executor(
+                self._executor,
+                lambda: self.w3.eth.filter({
+                    'address': self.core_contract,
+                    'topics': [self._indexed_topics],
+                    'fromBlock': self.last_processed_block + 1,
+                })
+            )
+            logger.info("Using server-side log filter for new events")
+            return log_filter
+        except Exception as e:
+            if not self._is_unsupported_method_error(e):
+                logger.error(f"Failed to install log filter: {e}")
+            logger.info("Falling back to block polling for new events")
+            return None
+
     async def _listen_for_new_events(self):
         """Listen for new events in real-time"""
         logger.info("Listening for new events...")
-        
+
+        # A server-side filter turns each tick into one eth_getFilterChanges
+        # that returns only new logs, instead of eth_blockNumber plus a
+        # get_logs when the chain advanced
+        log_filter = await self._install_log_filter()
+
         while self.running:
             try:
-                current_block = self.w3.eth.block_number
-                
-                if current_block > self.last_processed_block:
-                    await self._process_block_range(
-                        self.last_processed_block + 1,
-                        current_block
-                    )
-                    self.last_processed_block = current_block
-                
+                if log_filter is not None:
+                    await self._drain_log_filter(log_filter)
+                else:
+                    current_block = await self._get_block_number()
+
+                    if current_block > self.last_processed_block:
+                        await self._process_block_range(
+                            self.last_processed_block + 1,
+                            current_block
+                        )
+                        self.last_processed_block = current_block
+
             except Exception as e:
                 logger.error(f"Error listening for events: {e}")
-            
+                if log_filter is not None:
+                    # Filters expire server-side after idle periods; reinstall
+                    log_filter = await self._install_log_filter()
+
             await asyncio.sleep(2)  # Poll every 2 seconds
-    
-    async def _process_block_range(self, from_block: int, to_block: int):
-        """Process events in a block range"""
-        try:
-            # Get all events in range
-            events = []
-            
-            # ProblemPosted
-            problem_events = self.contract.events.ProblemPosted.get_logs(
-                fromBlock=from_block, toBlock=to_block
-            )
-            events.extend([('ProblemPosted', e) for e in problem_events])
-            
-            # OrderAccepted
-            accepted_events = self.contract.events.OrderAccepted.get_logs(
-                fromBlock=from_block, toBlock=to_block
-            )
-            events.extend([('OrderAccepted', e) for e in accepted_events])
-            
-            # SolutionCommitted
-            commit_events = self.contract.events.SolutionCommitted.get_logs(
-                fromBlock=from_block, toBlock=to_block
-            )
-            events.extend([('SolutionCommitted', e) for e in commit_events])
-            
-            # SolutionRevealed
-            reveal_events = self.contract.events.SolutionRevealed.get_logs(
-                fromBlock=from_block, toBlock=to_block
-            )
-            events.extend([('SolutionRevealed', e) for e in reveal_events])
-            
-            # ChallengeSubmitted
-            challenge_events = self.contract.events.ChallengeSubmitted.get_logs(
-                fromBlock=from_block, toBlock=to_block
+
+    async def _drain_log_filter(self, log_filter):
+        """Process logs the server-side filter accumulated since the last poll"""
+        loop = asyncio.get_event_loop()
+        logs = await loop.run_in_executor(self._executor, log_filter.get_new_entries)
+        if not logs:
+            return
+
+        events = self._decode_logs(logs)
+
+        await self._prefetch_block_timestamps(
+            {event.blockNumber for _, event in events}
+        )
+
+        batch = self._new_batch()
+        for event_type, event in events:
+            await self._handle_event(
+                event_type, event,
+                self._block_timestamps[event.blockNumber],
+                batch
             )
-            events.extend([('ChallengeSubmitted', e) for e in challenge_events])
-            
-            # Process each event
-            for event_type, event in events:
-                await self._handle_event(event_type, event)
-                
-        except Exception as e:
-            logger.error(f"Error processing blocks {from_block}-{to_block}: {e}")
+
+        top_block = max(event.blockNumber for _, event in events)
+        await self._flush_batch(batch, max(top_block, self.last_processed_block))
+        if top_block > self.last_processed_block:
+            self.last_processed_block = top_block
     
-    async def _handle_event(self, event_type: str, event):
-        """Handle a specific event"""
+    async def _process_block_range(self, from_block: int, to_block: int) -> int:
+        """Process events in a block range, returning the number of events"""
+        # All indexed event types share a single eth_getLogs call: the
+        # provider treats a nested topic list as an OR filter, so each
+        # range costs one round-trip instead of one per event type
+        loop = asyncio.get_event_loop()
+        events = await loop.run_in_executor(
+            self._executor, self._get_logs_for_range, from_block, to_block
+        )
+
+        # Fetch each unique block's timestamp once for the whole range
+        await self._prefetch_block_timestamps(
+            {event.blockNumber for _, event in events}
+        )
+
+        # Process each event, accumulating rows so each write type
+        # flushes to the database in a single round-trip
+        batch = self._new_batch()
+        for event_type, event in events:
+            await self._handle_event(
+                event_type, event,
+                self._block_timestamps[event.blockNumber],
+                batch
+            )
+        await self._flush_batch(batch, to_block)
+
+        return len(events)
+
+    def _get_logs_for_range(self, from_block: int, to_block: int) -> list:
+        """Fetch and decode all indexed events in a range with one eth_getLogs.
+
+        Returns (event_type, event) pairs ordered by (blockNumber, logIndex)
+        so replay preserves on-chain causality.
+        """
+        logs = self.w3.eth.get_logs({
+            'address': self.core_contract,
+            'topics': [self._indexed_topics],
+            'fromBlock': from_block,
+            'toBlock': to_block,
+        })
+        return self._decode_logs(logs)
+
+    def _decode_logs(self, logs) -> list:
+        """Decode raw logs into (event_type, event) pairs in causal order"""
+        events = []
+        for log in logs:
+            topic = log['topics'][0].hex()
+            if not topic.startswith('0x'):
+                topic = '0x' + topic
+            events.append((
+                self._name_by_topic[topic],
+                get_event_data(self.w3.codec, self._abi_by_topic[topic], log)
+            ))
+
+        events.sort(key=lambda pair: (pair[1].blockNumber, pair[1].logIndex))
+        return events
+
+    @staticmethod
+    def _new_batch() -> dict:
+        """Empty per-range accumulator for batched database writes"""
+        return {
+            'orders': [],
+            'solutions': [],
+            'challenges': [],
+            'status_updates': [],
+            'reveals': [],
+        }
+
+    async def _flush_batch(self, batch: dict, to_block: Optional[int] = None):
+        """Flush accumulated writes atomically, inserts before updates.
+
+        The whole batch shares one connection and transaction; passing
+        to_block persists the sync cursor in the same commit, so a crash
+        can never record progress past unwritten events (or vice versa).
+        """
+        async with self.database.block_batch() as writer:
+            await writer.insert_orders(batch['orders'])
+            await writer.insert_solutions(batch['solutions'])
+            await writer.insert_challenges(batch['challenges'])
+            await writer.update_order_statuses(batch['status_updates'])
+            await writer.reveal_solutions(batch['reveals'])
+            if to_block is not None:
+                await writer.set_last_processed_block(to_block)
+
+    async def _prefetch_block_timestamps(self, block_numbers: set):
+        """Fetch timestamps for uncached blocks concurrently"""
+        missing = [b for b in block_numbers if b not in self._block_timestamps]
+        if not missing:
+            return
+
+        loop = asyncio.get_event_loop()
+        blocks = await asyncio.gather(
+            *(loop.run_in_executor(self._executor, self.w3.eth.get_block, b) for b in missing)
+        )
+        for block_number, block in zip(missing, blocks):
+            self._block_timestamps[block_number] = block.timestamp
+
+        # Keep the cache bounded; old blocks are never revisited
+        if len(self._block_timestamps) > self._block_timestamp_cache_size:
+            for key in sorted(self._block_timestamps)[:-self._block_timestamp_cache_size]:
+                del self._block_timestamps[key]
+
+    async def _handle_event(self, event_type: str, event, block_timestamp: int, batch: dict):
+        """Handle a specific event by adding its rows to the batch"""
         try:
-            block = self.w3.eth.get_block(event.blockNumber)
-            timestamp = datetime.fromtimestamp(block.timestamp)
+            timestamp = datetime.fromtimestamp(block_timestamp)
             tx_hash = event.transactionHash.hex()
-            
+
             if event_type == 'ProblemPosted':
-                await self._handle_problem_posted(event, timestamp, tx_hash)
-                
+                self._handle_problem_posted(event, timestamp, tx_hash, batch)
+
             elif event_type == 'OrderAccepted':
-                await self._handle_order_accepted(event, timestamp, tx_hash)
-                
+                self._handle_order_accepted(event, timestamp, tx_hash, batch)
+
             elif event_type == 'SolutionCommitted':
-                await self._handle_solution_committed(event, timestamp, tx_hash)
-                
+                self._handle_solution_committed(event, timestamp, tx_hash, batch)
+
             elif event_type == 'SolutionRevealed':
-                await self._handle_solution_revealed(event, timestamp, tx_hash)
-                
+                self._handle_solution_revealed(event, timestamp, tx_hash, batch)
+
             elif event_type == 'ChallengeSubmitted':
-                await self._handle_challenge_submitted(event, timestamp, tx_hash)
-            
+                self._handle_challenge_submitted(event, timestamp, tx_hash, batch)
+
             # Broadcast to websockets
             if self.on_new_event:
                 await self.on_new_event(event_type, {
@@ -253,11 +454,11 @@ class EventListener:
                     'txHash': tx_hash,
                     'timestamp': timestamp.isoformat()
                 })
-                
+
         except Exception as e:
             logger.error(f"Error handling {event_type}: {e}")
-    
-    async def _handle_problem_posted(self, event, timestamp, tx_hash):
+
+    def _handle_problem_posted(self, event, timestamp, tx_hash, batch):
         """Handle ProblemPosted event"""
         order = Order(
             id=event.args.orderId,
@@ -272,19 +473,17 @@ class EventListener:
             tx_hash=tx_hash,
             block_number=event.blockNumber
         )
-        await self.database.insert_order(order)
+        batch['orders'].append(order)
         logger.info(f"Indexed ProblemPosted #{event.args.orderId}")
-    
-    async def _handle_order_accepted(self, event, timestamp, tx_hash):
+
+    def _handle_order_accepted(self, event, timestamp, tx_hash, batch):
         """Handle OrderAccepted event"""
-        await self.database.update_order_status(
-            event.args.orderId,
-            status=1,  # ACCEPTED
-            solver=event.args.solver
+        batch['status_updates'].append(
+            (event.args.orderId, 1, event.args.solver)  # ACCEPTED
         )
         logger.info(f"Indexed OrderAccepted #{event.args.orderId}")
-    
-    async def _handle_solution_committed(self, event, timestamp, tx_hash):
+
+    def _handle_solution_committed(self, event, timestamp, tx_hash, batch):
         """Handle SolutionCommitted event"""
         solution = Solution(
             order_id=event.args.orderId,
@@ -293,24 +492,17 @@ class EventListener:
             commit_time=timestamp,
             tx_hash=tx_hash
         )
-        await self.database.insert_solution(solution)
-        await self.database.update_order_status(event.args.orderId, status=2)
+        batch['solutions'].append(solution)
+        batch['status_updates'].append((event.args.orderId, 2, None))
         logger.info(f"Indexed SolutionCommitted #{event.args.orderId}")
-    
-    async def _handle_solution_revealed(self, event, timestamp, tx_hash):
+
+    def _handle_solution_revealed(self, event, timestamp, tx_hash, batch):
         """Handle SolutionRevealed event"""
-        # Update existing solution
-        existing = await self.database.get_solution(event.args.orderId)
-        if existing:
-            existing.solution = event.args.solution
-            existing.reveal_time = timestamp
-            existing.is_revealed = True
-            await self.database.insert_solution(existing)
-        
-        await self.database.update_order_status(event.args.orderId, status=3)
+        batch['reveals'].append((event.args.orderId, event.args.solution, timestamp))
+        batch['status_updates'].append((event.args.orderId, 3, None))
         logger.info(f"Indexed SolutionRevealed #{event.args.orderId}")
-    
-    async def _handle_challenge_submitted(self, event, timestamp, tx_hash):
+
+    def _handle_challenge_submitted(self, event, timestamp, tx_hash, batch):
         """Handle ChallengeSubmitted event"""
         challenge = Challenge(
             order_id=event.args.orderId,
@@ -320,6 +512,6 @@ class EventListener:
             challenge_time=timestamp,
             tx_hash=tx_hash
         )
-        await self.database.insert_challenge(challenge)
-        await self.database.update_order_status(event.args.orderId, status=5)
+        batch['challenges'].append(challenge)
+        batch['status_updates'].append((event.args.orderId, 5, None))
         logger.info(f"Indexed ChallengeSubmitted #{event.args.orderId}")
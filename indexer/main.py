@@ -11,13 +11,21 @@ Features:
 """
 
 import os
+import atexit
 import asyncio
 import logging
+import queue
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Set
+
+import orjson
+from cachetools import TTLCache
 
 from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -27,11 +35,22 @@ from api.orders import router as orders_router
 from api.solutions import router as solutions_router
 from api.stats import router as stats_router
 
-# Configure logging
+# Configure logging. Records are routed through a queue so handler I/O
+# (stdout can block on a full pipe under container log pressure) happens
+# on a background thread rather than the event loop.
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger("Indexer")
 
 
@@ -52,7 +71,7 @@ class IndexerConfig:
 config = IndexerConfig.from_env()
 db = Database(config.database_url)
 event_listener: Optional[EventListener] = None
-connected_websockets: List[WebSocket] = []
+connected_websockets: Set[WebSocket] = set()
 
 
 @asynccontextmanager
@@ -62,6 +81,7 @@ async def lifespan(app: FastAPI):
     
     # Startup
     logger.info("Starting Ominis Indexer...")
+    app.state.db = db
     await db.connect()
     await db.create_tables()
     
@@ -88,12 +108,29 @@ async def lifespan(app: FastAPI):
     await db.disconnect()
 
 
+def _orjson_default(obj):
+    """Fallback for chain-native types orjson doesn't handle (HexBytes, Decimal)"""
+    if isinstance(obj, bytes):
+        return obj.hex()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
+class IndexerJSONResponse(ORJSONResponse):
+    """ORJSONResponse with fallbacks for values coming straight off the chain"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NAIVE_UTC)
+
+
 # Create app
 app = FastAPI(
     title="Ominis Indexer API",
     description="REST API for querying Ominis Protocol data",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=IndexerJSONResponse
 )
 
 # CORS
@@ -115,24 +152,29 @@ app.include_router(stats_router, prefix="/api", tags=["stats"])
 
 async def broadcast_event(event_type: str, data: dict):
     """Broadcast event to all connected websockets"""
-    message = {"type": event_type, "data": data}
-    disconnected = []
-    
-    for ws in connected_websockets:
-        try:
-            await ws.send_json(message)
-        except:
-            disconnected.append(ws)
-    
-    for ws in disconnected:
-        connected_websockets.remove(ws)
+    if not connected_websockets:
+        return
+
+    # Serialize once, then fan out concurrently so one slow client only
+    # costs max(write time) rather than the sum
+    payload = orjson.dumps({"type": event_type, "data": data})
+    recipients = list(connected_websockets)
+
+    results = await asyncio.gather(
+        *(ws.send_bytes(payload) for ws in recipients),
+        return_exceptions=True
+    )
+
+    for ws, result in zip(recipients, results):
+        if isinstance(result, Exception):
+            connected_websockets.discard(ws)
 
 
 @app.websocket("/api/stream")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
     await websocket.accept()
-    connected_websockets.append(websocket)
+    connected_websockets.add(websocket)
     logger.info(f"WebSocket connected. Total: {len(connected_websockets)}")
     
     try:
@@ -140,7 +182,7 @@ async def websocket_endpoint(websocket: WebSocket):
             # Keep connection alive
             await websocket.receive_text()
     except WebSocketDisconnect:
-        connected_websockets.remove(websocket)
+        connected_websockets.discard(websocket)
         logger.info(f"WebSocket disconnected. Total: {len(connected_websockets)}")
 
 
@@ -160,22 +202,42 @@ async def health():
     return {
         "status": "healthy",
         "database": await db.is_connected(),
+        "pool": db.pool_stats(),
         "event_listener": event_listener is not None and event_listener.running,
         "websockets": len(connected_websockets)
     }
 
 
+# Sync status is polled aggressively by the frontend but only needs the
+# order count from the DB; a short TTL keeps that query off the hot path
+_sync_status_cache = TTLCache(maxsize=1, ttl=2)
+_sync_status_lock = asyncio.Lock()
+
+
 @app.get("/api/sync-status")
 async def sync_status():
-    """Get current sync status"""
+    """Get current sync status (cached for a couple of seconds)"""
     if not event_listener:
         return {"synced": False, "message": "Event listener not running"}
-    
-    return {
-        "synced": True,
-        "last_block": event_listener.last_processed_block,
-        "orders_indexed": await db.get_order_count()
-    }
+
+    try:
+        return _sync_status_cache["status"]
+    except KeyError:
+        pass
+
+    async with _sync_status_lock:
+        try:
+            return _sync_status_cache["status"]
+        except KeyError:
+            pass
+
+        status = {
+            "synced": True,
+            "last_block": event_listener.last_processed_block,
+            "orders_indexed": await db.get_order_count()
+        }
+        _sync_status_cache["status"] = status
+        return status
 
 
 if __name__ == "__main__":
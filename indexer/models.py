@@ -3,9 +3,16 @@ Database models for Ominis Indexer
 """
 
 import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Optional, List
 from dataclasses import dataclass
+from functools import lru_cache
+
+from cachetools import LRUCache
 
 # Use asyncpg for async PostgreSQL
 try:
@@ -14,8 +21,10 @@ try:
 except ImportError:
     ASYNCPG_AVAILABLE = False
 
+logger = logging.getLogger("Database")
+
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order model"""
     id: int
@@ -32,7 +41,7 @@ class Order:
     block_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Solution:
     """Solution model"""
     order_id: int
@@ -46,7 +55,7 @@ class Solution:
     tx_hash: Optional[str] = None
 
 
-@dataclass 
+@dataclass(slots=True)
 class Challenge:
     """Challenge model"""
     order_id: int
@@ -59,33 +68,364 @@ class Challenge:
     tx_hash: Optional[str] = None
 
 
+# Explicit projections in dataclass field order: they keep indexed_at and
+# other bookkeeping columns off the wire and let the row converters below
+# build dataclasses positionally
+_ORDER_COLUMNS = ('id, issuer, problem_hash, problem_type, time_tier, status, '
+                  'reward, created_at, deadline, solver, tx_hash, block_number')
+_ORDER_COLUMN_NAMES = tuple(c.strip() for c in _ORDER_COLUMNS.split(','))
+_SOLUTION_COLUMNS = ('order_id, solver, commit_hash, solution, salt, '
+                     'commit_time, reveal_time, is_revealed, tx_hash')
+_CHALLENGE_COLUMNS = ('order_id, challenger, stake, reason, challenge_time, '
+                      'resolved, challenger_won, tx_hash')
+
+
+def _row_to_order(row) -> Order:
+    """Build an Order positionally, skipping dict(row) and kwarg matching"""
+    return Order(row[0], row[1], row[2], row[3], row[4], row[5],
+                 row[6], row[7], row[8], row[9], row[10], row[11])
+
+
+def _row_to_solution(row) -> Solution:
+    """Build a Solution positionally from a record"""
+    return Solution(row[0], row[1], row[2], row[3], row[4],
+                    row[5], row[6], row[7], row[8])
+
+
+def _row_to_challenge(row) -> Challenge:
+    """Build a Challenge positionally from a record"""
+    return Challenge(row[0], row[1], row[2], row[3], row[4],
+                     row[5], row[6], row[7])
+
+
+def _build_orders(rows) -> List[Order]:
+    """Convert a batch of records to Orders; run off-loop for large batches"""
+    return [_row_to_order(row) for row in rows]
+
+
+def _order_params(o: Order) -> tuple:
+    """Parameter tuple for the order insert statements"""
+    return (o.id, o.issuer, o.problem_hash, o.problem_type, o.time_tier,
+            o.status, o.reward, o.created_at, o.deadline, o.solver,
+            o.tx_hash, o.block_number)
+
+
+def _solution_params(s: Solution) -> tuple:
+    """Parameter tuple for the solution insert statements"""
+    return (s.order_id, s.solver, s.commit_hash, s.solution, s.salt,
+            s.commit_time, s.reveal_time, s.is_revealed, s.tx_hash)
+
+
+def _challenge_params(c: Challenge) -> tuple:
+    """Parameter tuple for the challenge insert statements"""
+    return (c.order_id, c.challenger, c.stake, c.reason, c.challenge_time,
+            c.resolved, c.challenger_won, c.tx_hash)
+
+
+# SQL is hoisted to module level so every call site passes the identical
+# statement text. asyncpg's per-connection statement cache is keyed by
+# that text, so stable strings mean each query is parsed and planned once
+# per connection instead of once per call.
+
+_INSERT_ORDER_SQL = '''
+    INSERT INTO orders (id, issuer, problem_hash, problem_type, time_tier,
+                       status, reward, created_at, deadline, solver, tx_hash, block_number)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+    ON CONFLICT (id) DO UPDATE SET
+        status = EXCLUDED.status,
+        solver = EXCLUDED.solver
+'''
+
+# Order batches are folded into multi-row VALUES statements: one Bind and
+# one Execute per chunk instead of one per row. Statement texts only vary
+# by chunk size, so the cache stays tiny (full chunks plus remainders).
+_MULTIROW_CHUNK = 500
+
+
+@lru_cache(maxsize=None)
+def _multirow_order_sql(n_rows: int) -> str:
+    """Order upsert with n_rows VALUES tuples"""
+    width = len(_ORDER_COLUMN_NAMES)
+    values = ','.join(
+        '(' + ','.join(f'${r * width + c + 1}' for c in range(width)) + ')'
+        for r in range(n_rows)
+    )
+    return (
+        f'INSERT INTO orders ({_ORDER_COLUMNS}) VALUES {values} '
+        'ON CONFLICT (id) DO UPDATE SET '
+        'status = EXCLUDED.status, solver = EXCLUDED.solver'
+    )
+
+
+async def _insert_orders_multirow(conn, orders: List[Order]):
+    """Upsert orders in multi-row chunks on an already-acquired connection"""
+    for i in range(0, len(orders), _MULTIROW_CHUNK):
+        chunk = orders[i:i + _MULTIROW_CHUNK]
+        params = [p for o in chunk for p in _order_params(o)]
+        await conn.execute(_multirow_order_sql(len(chunk)), *params)
+
+
+_UPDATE_ORDER_STATUS_SQL = (
+    'UPDATE orders SET status = $2, solver = COALESCE($3, solver) WHERE id = $1'
+)
+
+_GET_ORDER_SQL = f'SELECT {_ORDER_COLUMNS} FROM orders WHERE id = $1'
+
+# NULL filter parameters match everything, so one statement (and one
+# cached plan) covers every filter combination
+_GET_ORDERS_SQL = f'''
+    SELECT {_ORDER_COLUMNS} FROM orders
+    WHERE ($1::smallint IS NULL OR status = $1)
+      AND ($2::varchar IS NULL OR issuer = $2)
+      AND ($3::varchar IS NULL OR solver = $3)
+    ORDER BY created_at DESC LIMIT $4 OFFSET $5
+'''
+
+_GET_ORDERS_WITH_TOTAL_SQL = f'''
+    SELECT {_ORDER_COLUMNS}, count(*) OVER() AS total FROM orders
+    WHERE ($1::smallint IS NULL OR status = $1)
+      AND ($2::varchar IS NULL OR issuer = $2)
+      AND ($3::varchar IS NULL OR solver = $3)
+    ORDER BY created_at DESC LIMIT $4 OFFSET $5
+'''
+
+def _orders_query_variants(projection: str) -> dict:
+    """Specialized list statements keyed by (has_status, has_issuer, has_solver).
+
+    The dashboard traffic is almost entirely unfiltered or single-filter
+    pages; plain predicates let the planner match the composite indexes
+    directly instead of reasoning about NULL-tolerant clauses. Rarer
+    filter combinations fall back to the generic statement.
+    """
+    base = f'SELECT {projection} FROM orders'
+    tail = ' ORDER BY created_at DESC LIMIT $2 OFFSET $3'
+    return {
+        (False, False, False): base + ' ORDER BY created_at DESC LIMIT $1 OFFSET $2',
+        (True, False, False): base + ' WHERE status = $1' + tail,
+        (False, True, False): base + ' WHERE issuer = $1' + tail,
+        (False, False, True): base + ' WHERE solver = $1' + tail,
+    }
+
+
+_GET_ORDERS_VARIANTS = _orders_query_variants(_ORDER_COLUMNS)
+_GET_ORDERS_WITH_TOTAL_VARIANTS = _orders_query_variants(
+    _ORDER_COLUMNS + ', count(*) OVER() AS total'
+)
+
+# Fallback totals for pages past the end of the result set, where the
+# windowed count vanishes along with the rows
+_COUNT_ORDERS_SQL = '''
+    SELECT COUNT(*) FROM orders
+    WHERE ($1::smallint IS NULL OR status = $1)
+      AND ($2::varchar IS NULL OR issuer = $2)
+      AND ($3::varchar IS NULL OR solver = $3)
+'''
+
+_COUNT_ORDERS_VARIANTS = {
+    (False, False, False): 'SELECT COUNT(*) FROM orders',
+    (True, False, False): 'SELECT COUNT(*) FROM orders WHERE status = $1',
+    (False, True, False): 'SELECT COUNT(*) FROM orders WHERE issuer = $1',
+    (False, False, True): 'SELECT COUNT(*) FROM orders WHERE solver = $1',
+}
+
+_ITER_ORDERS_SQL = f'''
+    SELECT {_ORDER_COLUMNS} FROM orders
+    WHERE ($1::smallint IS NULL OR status = $1)
+      AND ($2::varchar IS NULL OR issuer = $2)
+      AND ($3::varchar IS NULL OR solver = $3)
+    ORDER BY created_at DESC
+'''
+
+_INSERT_SOLUTION_SQL = '''
+    INSERT INTO solutions (order_id, solver, commit_hash, solution, salt,
+                          commit_time, reveal_time, is_revealed, tx_hash)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    ON CONFLICT (order_id) DO UPDATE SET
+        solution = EXCLUDED.solution,
+        salt = EXCLUDED.salt,
+        reveal_time = EXCLUDED.reveal_time,
+        is_revealed = EXCLUDED.is_revealed
+'''
+
+_REVEAL_SOLUTION_SQL = '''
+    UPDATE solutions SET solution = $2, reveal_time = $3, is_revealed = TRUE
+    WHERE order_id = $1
+'''
+
+_GET_SOLUTION_SQL = f'SELECT {_SOLUTION_COLUMNS} FROM solutions WHERE order_id = $1'
+
+# ANY-array fan-in: one plan serves any batch size, so fetching related
+# rows for a page is a fixed number of round-trips instead of N+1
+_GET_SOLUTIONS_FOR_ORDERS_SQL = (
+    f'SELECT {_SOLUTION_COLUMNS} FROM solutions WHERE order_id = ANY($1::bigint[])'
+)
+_GET_CHALLENGES_FOR_ORDERS_SQL = (
+    f'SELECT {_CHALLENGE_COLUMNS} FROM challenges WHERE order_id = ANY($1::bigint[])'
+)
+
+_INSERT_CHALLENGE_SQL = '''
+    INSERT INTO challenges (order_id, challenger, stake, reason,
+                           challenge_time, resolved, challenger_won, tx_hash)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    ON CONFLICT (order_id) DO UPDATE SET
+        resolved = EXCLUDED.resolved,
+        challenger_won = EXCLUDED.challenger_won
+'''
+
+_GET_CHALLENGE_SQL = f'SELECT {_CHALLENGE_COLUMNS} FROM challenges WHERE order_id = $1'
+
+_GET_STATS_SQL = '''
+    SELECT
+        COUNT(*) AS total_orders,
+        COUNT(*) FILTER (WHERE status = 0) AS open_orders,
+        COUNT(*) FILTER (WHERE status = 4) AS completed_orders,
+        (SELECT COUNT(*) FROM challenges) AS total_challenges
+    FROM orders
+'''
+
+_GET_LAST_BLOCK_SQL = 'SELECT last_block FROM sync_state WHERE id = 1'
+
+_SET_LAST_BLOCK_SQL = '''
+    INSERT INTO sync_state (id, last_block) VALUES (1, $1)
+    ON CONFLICT (id) DO UPDATE SET last_block = EXCLUDED.last_block
+'''
+
+
+# Connection pinned by Database.unit_of_work for the current task tree;
+# query methods pick it up instead of re-acquiring from the pool
+_current_conn: ContextVar = ContextVar('ominis_db_conn', default=None)
+
+
 class Database:
     """
     Database manager for Ominis Indexer.
     Uses PostgreSQL with asyncpg for async operations.
     """
-    
+
+    # Pool sizing: keep a few warm connections for the API hot path while
+    # capping total connections under concurrent load
+    POOL_MIN_SIZE = 5
+    POOL_MAX_SIZE = 20
+    POOL_MAX_INACTIVE_LIFETIME = 1800.0  # Recycle idle connections after 30 min
+    COMMAND_TIMEOUT = 30.0
+    STATEMENT_CACHE_SIZE = 256  # Comfortably holds every distinct query here
+    COUNTER_RECONCILE_INTERVAL = 60.0  # Seconds between counter re-syncs
+
+    # Row batches above this size are converted to dataclasses in the
+    # default executor so a big export can't stall the event loop
+    ROW_BUILD_OFFLOAD_THRESHOLD = 500
+
+    # Statuses after which an order row can never change again
+    TERMINAL_ORDER_STATUSES = frozenset({4, 6, 7, 8})
+    POINT_CACHE_SIZE = 4096
+
+    # One pool per database URL, shared across instances: worker tasks and
+    # tests that construct their own Database reuse the tuned pool instead
+    # of stacking fresh default-sized pools onto Postgres
+    _shared_pools: dict = {}
+    _pool_lock = asyncio.Lock()
+
     def __init__(self, database_url: str):
         self.database_url = database_url
         self.pool: Optional[asyncpg.Pool] = None
-    
+
+        # In-process stat counters, maintained incrementally by the write
+        # paths so get_stats never needs a table scan. Seeded from SQL on
+        # first use and periodically re-synced to heal any drift (e.g.
+        # upserts that didn't actually create a row).
+        self._counts: Optional[dict] = None
+        self._reconcile_task: Optional[asyncio.Task] = None
+
+        # Point-lookup caches. Only rows that can no longer change are
+        # cached (terminal orders, revealed solutions, resolved
+        # challenges), so no TTL is needed; writes invalidate anyway as
+        # a belt-and-braces measure.
+        self._order_cache = LRUCache(maxsize=self.POINT_CACHE_SIZE)
+        self._solution_cache = LRUCache(maxsize=self.POINT_CACHE_SIZE)
+        self._challenge_cache = LRUCache(maxsize=self.POINT_CACHE_SIZE)
+
     async def connect(self):
         """Connect to database"""
         if not ASYNCPG_AVAILABLE:
-            print("Warning: asyncpg not installed, using mock database")
+            logger.warning("asyncpg not installed, using mock database")
             return
-        
-        try:
-            self.pool = await asyncpg.create_pool(self.database_url)
-            print("Connected to PostgreSQL")
-        except Exception as e:
-            print(f"Failed to connect to database: {e}")
-            print("Using in-memory mock database")
-    
+
+        async with Database._pool_lock:
+            shared = Database._shared_pools.get(self.database_url)
+            if shared is not None:
+                self.pool = shared
+                return
+
+            try:
+                self.pool = await asyncpg.create_pool(
+                    self.database_url,
+                    min_size=self.POOL_MIN_SIZE,
+                    max_size=self.POOL_MAX_SIZE,
+                    max_inactive_connection_lifetime=self.POOL_MAX_INACTIVE_LIFETIME,
+                    command_timeout=self.COMMAND_TIMEOUT,
+                    statement_cache_size=self.STATEMENT_CACHE_SIZE,
+                    setup=self._setup_connection
+                )
+                Database._shared_pools[self.database_url] = self.pool
+                logger.info("Connected to PostgreSQL")
+            except Exception as e:
+                logger.error(f"Failed to connect to database: {e}")
+                logger.warning("Using in-memory mock database")
+
+    @staticmethod
+    async def _setup_connection(conn):
+        """Pre-ping each pooled connection so dead ones never reach queries"""
+        await conn.execute('SELECT 1')
+
+    @asynccontextmanager
+    async def _conn(self):
+        """Yield the pinned unit-of-work connection if set, else acquire"""
+        pinned = _current_conn.get()
+        if pinned is not None:
+            yield pinned
+            return
+
+        async with self.pool.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def unit_of_work(self):
+        """Pin one connection and transaction across several calls.
+
+        Every Database call inside the block shares a single acquired
+        connection and commits (or rolls back) together, instead of each
+        method paying its own acquire.
+        """
+        if not self.pool:
+            yield
+            return
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                token = _current_conn.set(conn)
+                try:
+                    yield
+                finally:
+                    _current_conn.reset(token)
+
+    def pool_stats(self) -> dict:
+        """Current pool size/idle counts for health reporting"""
+        if not self.pool:
+            return {"size": 0, "idle": 0}
+        return {
+            "size": self.pool.get_size(),
+            "idle": self.pool.get_idle_size()
+        }
+
     async def disconnect(self):
         """Disconnect from database"""
+        if self._reconcile_task:
+            self._reconcile_task.cancel()
+            self._reconcile_task = None
         if self.pool:
+            Database._shared_pools.pop(self.database_url, None)
             await self.pool.close()
+            self.pool = None
     
     async def is_connected(self) -> bool:
         """Check if connected"""
@@ -96,7 +436,7 @@ class Database:
         if not self.pool:
             return
         
-        async with self.pool.acquire() as conn:
+        async with self._conn() as conn:
             await conn.execute('''
                 CREATE TABLE IF NOT EXISTS orders (
                     id BIGINT PRIMARY KEY,
@@ -142,11 +482,41 @@ class Database:
                 )
             ''')
             
-            # Create indexes
-            await conn.execute('CREATE INDEX IF NOT EXISTS idx_orders_issuer ON orders(issuer)')
-            await conn.execute('CREATE INDEX IF NOT EXISTS idx_orders_solver ON orders(solver)')
-            await conn.execute('CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)')
+            await conn.execute('''
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    id SMALLINT PRIMARY KEY,
+                    last_block BIGINT NOT NULL
+                )
+            ''')
+
+            # Create indexes matching the get_orders filter combinations so
+            # every list endpoint is an index range scan in created_at order
+            await conn.execute('CREATE INDEX IF NOT EXISTS idx_orders_issuer ON orders(issuer, created_at DESC)')
+            await conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_orders_solver
+                ON orders(solver, created_at DESC) WHERE solver IS NOT NULL
+            ''')
+            await conn.execute('CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status, created_at DESC)')
             await conn.execute('CREATE INDEX IF NOT EXISTS idx_orders_created ON orders(created_at DESC)')
+            # Keep the heap physically ordered by created_at so the
+            # ORDER BY created_at DESC pages read sequential blocks.
+            # (Partitioning by status would force status into the primary
+            # key and break the solutions/challenges foreign keys, so the
+            # cluster marker is the right-sized fix here; maintenance
+            # CLUSTER runs pick it up.)
+            await conn.execute('ALTER TABLE orders CLUSTER ON idx_orders_created')
+
+            # Partial covering index: open orders are the hottest dashboard
+            # query, and with every projected column INCLUDEd the page is
+            # served by an index-only scan. Only open orders are indexed,
+            # so it stays small as the table grows.
+            await conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_orders_open_created
+                ON orders(created_at DESC)
+                INCLUDE (id, issuer, problem_hash, problem_type, time_tier,
+                         status, reward, deadline, solver, tx_hash, block_number)
+                WHERE status = 0
+            ''')
     
     # ============ Order Operations ============
     
@@ -155,45 +525,98 @@ class Database:
         if not self.pool:
             return False
         
-        async with self.pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO orders (id, issuer, problem_hash, problem_type, time_tier, 
-                                   status, reward, created_at, deadline, solver, tx_hash, block_number)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                ON CONFLICT (id) DO UPDATE SET
-                    status = EXCLUDED.status,
-                    solver = EXCLUDED.solver
-            ''', order.id, order.issuer, order.problem_hash, order.problem_type,
+        async with self._conn() as conn:
+            await conn.execute(
+                _INSERT_ORDER_SQL,
+                order.id, order.issuer, order.problem_hash, order.problem_type,
                 order.time_tier, order.status, order.reward, order.created_at,
                 order.deadline, order.solver, order.tx_hash, order.block_number)
+
+        self._order_cache.pop(order.id, None)
+        self._bump('total_orders')
+        if order.status == 0:
+            self._bump('open_orders')
         return True
     
+    async def insert_orders(self, orders: List[Order]) -> bool:
+        """Insert a batch of orders in a single round-trip"""
+        if not self.pool or not orders:
+            return False
+
+        async with self._conn() as conn:
+            await _insert_orders_multirow(conn, orders)
+
+        for o in orders:
+            self._order_cache.pop(o.id, None)
+        self._bump('total_orders', len(orders))
+        self._bump('open_orders', sum(1 for o in orders if o.status == 0))
+        return True
+
+    async def backfill_orders(self, orders: List[Order]) -> int:
+        """Bulk-load orders with binary COPY for clean backfills.
+
+        COPY streams rows without per-row INSERT overhead but has no
+        conflict handling, so this is only for re-indexing into an empty
+        (or truncated) orders table; mid-stream ingest stays on the
+        upsert path. Returns the number of rows loaded.
+        """
+        if not self.pool or not orders:
+            return 0
+
+        async with self._conn() as conn:
+            await conn.copy_records_to_table(
+                'orders',
+                records=(_order_params(o) for o in orders),
+                columns=_ORDER_COLUMN_NAMES
+            )
+
+        self._bump('total_orders', len(orders))
+        self._bump('open_orders', sum(1 for o in orders if o.status == 0))
+        return len(orders)
+
     async def update_order_status(self, order_id: int, status: int, solver: str = None):
         """Update order status"""
         if not self.pool:
             return
         
-        async with self.pool.acquire() as conn:
-            if solver:
-                await conn.execute(
-                    'UPDATE orders SET status = $2, solver = $3 WHERE id = $1',
-                    order_id, status, solver
-                )
-            else:
-                await conn.execute(
-                    'UPDATE orders SET status = $2 WHERE id = $1',
-                    order_id, status
-                )
-    
+        async with self._conn() as conn:
+            await conn.execute(_UPDATE_ORDER_STATUS_SQL, order_id, status, solver)
+
+        self._order_cache.pop(order_id, None)
+        self._track_status_change(status)
+
+    async def update_order_statuses(self, updates: List[tuple]) -> bool:
+        """Apply a batch of (order_id, status, solver) updates in one round-trip.
+
+        A None solver leaves the existing solver untouched.
+        """
+        if not self.pool or not updates:
+            return False
+
+        async with self._conn() as conn:
+            await conn.executemany(_UPDATE_ORDER_STATUS_SQL, updates)
+
+        for order_id, status, _ in updates:
+            self._order_cache.pop(order_id, None)
+            self._track_status_change(status)
+        return True
+
     async def get_order(self, order_id: int) -> Optional[Order]:
         """Get order by ID"""
         if not self.pool:
             return None
-        
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow('SELECT * FROM orders WHERE id = $1', order_id)
+
+        cached = self._order_cache.get(order_id)
+        if cached is not None:
+            return cached
+
+        async with self._conn() as conn:
+            row = await conn.fetchrow(_GET_ORDER_SQL, order_id)
             if row:
-                return Order(**dict(row))
+                order = _row_to_order(row)
+                if order.status in self.TERMINAL_ORDER_STATUSES:
+                    self._order_cache[order_id] = order
+                return order
         return None
     
     async def get_orders(
@@ -207,39 +630,170 @@ class Database:
         """Get orders with filters"""
         if not self.pool:
             return []
-        
-        query = 'SELECT * FROM orders WHERE 1=1'
-        params = []
-        param_idx = 1
-        
-        if status is not None:
-            query += f' AND status = ${param_idx}'
-            params.append(status)
-            param_idx += 1
-        
-        if issuer:
-            query += f' AND issuer = ${param_idx}'
-            params.append(issuer)
-            param_idx += 1
-        
-        if solver:
-            query += f' AND solver = ${param_idx}'
-            params.append(solver)
-            param_idx += 1
-        
-        query += f' ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}'
-        params.extend([limit, offset])
-        
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-            return [Order(**dict(row)) for row in rows]
+
+        key = (status is not None, bool(issuer), bool(solver))
+        sql = _GET_ORDERS_VARIANTS.get(key)
+        if sql is not None:
+            filters = [v for v, present in
+                       ((status, key[0]), (issuer, key[1]), (solver, key[2]))
+                       if present]
+            params = (*filters, limit, offset)
+        else:
+            sql = _GET_ORDERS_SQL
+            params = (status, issuer, solver, limit, offset)
+
+        async with self._conn() as conn:
+            rows = await conn.fetch(sql, *params)
+
+        if len(rows) > self.ROW_BUILD_OFFLOAD_THRESHOLD:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, _build_orders, rows
+            )
+        return _build_orders(rows)
     
+    async def get_orders_with_total(
+        self,
+        status: Optional[int] = None,
+        issuer: Optional[str] = None,
+        solver: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> tuple:
+        """Get a page of orders plus the total matching count in one query.
+
+        Uses count(*) OVER() so pagination doesn't need a second COUNT
+        round-trip. Returns (orders, total).
+        """
+        if not self.pool:
+            return [], 0
+
+        key = (status is not None, bool(issuer), bool(solver))
+        sql = _GET_ORDERS_WITH_TOTAL_VARIANTS.get(key)
+        if sql is not None:
+            filters = [v for v, present in
+                       ((status, key[0]), (issuer, key[1]), (solver, key[2]))
+                       if present]
+            params = (*filters, limit, offset)
+        else:
+            sql = _GET_ORDERS_WITH_TOTAL_SQL
+            params = (status, issuer, solver, limit, offset)
+
+        async with self._conn() as conn:
+            rows = await conn.fetch(sql, *params)
+            if not rows and offset:
+                # Page past the last row: report the true total so
+                # paginating clients don't see it collapse to 0
+                count_sql = _COUNT_ORDERS_VARIANTS.get(key, _COUNT_ORDERS_SQL)
+                total = await conn.fetchval(count_sql, *params[:-2])
+                return [], total or 0
+        if not rows:
+            return [], 0
+
+        # The windowed total is appended after the projected columns,
+        # so the positional converter is unaffected by it
+        total = rows[0]['total']
+        if len(rows) > self.ROW_BUILD_OFFLOAD_THRESHOLD:
+            orders = await asyncio.get_running_loop().run_in_executor(
+                None, _build_orders, rows
+            )
+        else:
+            orders = _build_orders(rows)
+        return orders, total
+
+    async def iter_orders(
+        self,
+        status: Optional[int] = None,
+        issuer: Optional[str] = None,
+        solver: Optional[str] = None,
+        prefetch: int = 1000
+    ):
+        """Stream matching orders without materializing the result set.
+
+        Uses a server-side cursor (inside the transaction asyncpg
+        requires for cursors), pulling rows in prefetch-sized batches so
+        exports and analytics over large tables keep memory flat and see
+        their first rows immediately.
+        """
+        if not self.pool:
+            return
+
+        async with self._conn() as conn:
+            async with conn.transaction():
+                async for row in conn.cursor(
+                    _ITER_ORDERS_SQL, status, issuer, solver, prefetch=prefetch
+                ):
+                    yield _row_to_order(row)
+
+    async def get_orders_with_related(
+        self,
+        status: Optional[int] = None,
+        issuer: Optional[str] = None,
+        solver: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> tuple:
+        """Get a page of orders plus their solutions and challenges.
+
+        Related rows are fanned in with = ANY(ids), so a page costs a
+        fixed three round-trips instead of one per order. Returns
+        (orders, solutions_by_order_id, challenges_by_order_id, total).
+        """
+        orders, total = await self.get_orders_with_total(
+            status=status, issuer=issuer, solver=solver, limit=limit, offset=offset
+        )
+        if not orders:
+            return [], {}, {}, total
+
+        # The two fan-in queries are independent; running them on separate
+        # pool connections overlaps their round-trips. On a pinned
+        # unit-of-work connection they must run in sequence instead —
+        # one connection can't execute concurrently.
+        order_ids = [o.id for o in orders]
+        if _current_conn.get() is not None:
+            solution_rows = await self._fetch(_GET_SOLUTIONS_FOR_ORDERS_SQL, order_ids)
+            challenge_rows = await self._fetch(_GET_CHALLENGES_FOR_ORDERS_SQL, order_ids)
+        else:
+            solution_rows, challenge_rows = await asyncio.gather(
+                self._fetch(_GET_SOLUTIONS_FOR_ORDERS_SQL, order_ids),
+                self._fetch(_GET_CHALLENGES_FOR_ORDERS_SQL, order_ids)
+            )
+
+        solutions = {row[0]: _row_to_solution(row) for row in solution_rows}
+        challenges = {row[0]: _row_to_challenge(row) for row in challenge_rows}
+        return orders, solutions, challenges, total
+
+    async def _fetch(self, sql: str, *params) -> list:
+        """Run one fetch on its own pooled connection (gather-friendly)"""
+        async with self._conn() as conn:
+            return await conn.fetch(sql, *params)
+
+    async def get_order_bundle(self, order_id: int) -> tuple:
+        """Fetch an order plus its solution and challenge concurrently.
+
+        The three point reads are independent, so they run on separate
+        pool connections and the caller pays one round-trip of latency
+        instead of three. Returns (order, solution, challenge), each
+        possibly None.
+        """
+        if _current_conn.get() is not None:
+            return (
+                await self.get_order(order_id),
+                await self.get_solution(order_id),
+                await self.get_challenge(order_id)
+            )
+
+        return tuple(await asyncio.gather(
+            self.get_order(order_id),
+            self.get_solution(order_id),
+            self.get_challenge(order_id)
+        ))
+
     async def get_order_count(self, status: Optional[int] = None) -> int:
         """Get order count"""
         if not self.pool:
             return 0
         
-        async with self.pool.acquire() as conn:
+        async with self._conn() as conn:
             if status is not None:
                 return await conn.fetchval(
                     'SELECT COUNT(*) FROM orders WHERE status = $1', status
@@ -253,32 +807,58 @@ class Database:
         if not self.pool:
             return False
         
-        async with self.pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO solutions (order_id, solver, commit_hash, solution, salt,
-                                      commit_time, reveal_time, is_revealed, tx_hash)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                ON CONFLICT (order_id) DO UPDATE SET
-                    solution = EXCLUDED.solution,
-                    salt = EXCLUDED.salt,
-                    reveal_time = EXCLUDED.reveal_time,
-                    is_revealed = EXCLUDED.is_revealed
-            ''', solution.order_id, solution.solver, solution.commit_hash,
+        async with self._conn() as conn:
+            await conn.execute(
+                _INSERT_SOLUTION_SQL,
+                solution.order_id, solution.solver, solution.commit_hash,
                 solution.solution, solution.salt, solution.commit_time,
                 solution.reveal_time, solution.is_revealed, solution.tx_hash)
+
+        self._solution_cache.pop(solution.order_id, None)
         return True
     
+    async def insert_solutions(self, solutions: List[Solution]) -> bool:
+        """Insert a batch of solutions in a single round-trip"""
+        if not self.pool or not solutions:
+            return False
+
+        async with self._conn() as conn:
+            await conn.executemany(
+                _INSERT_SOLUTION_SQL, [_solution_params(s) for s in solutions]
+            )
+
+        for s in solutions:
+            self._solution_cache.pop(s.order_id, None)
+        return True
+
+    async def reveal_solutions(self, reveals: List[tuple]) -> bool:
+        """Apply a batch of (order_id, solution, reveal_time) reveals in one round-trip"""
+        if not self.pool or not reveals:
+            return False
+
+        async with self._conn() as conn:
+            await conn.executemany(_REVEAL_SOLUTION_SQL, reveals)
+
+        for order_id, _, _ in reveals:
+            self._solution_cache.pop(order_id, None)
+        return True
+
     async def get_solution(self, order_id: int) -> Optional[Solution]:
         """Get solution by order ID"""
         if not self.pool:
             return None
         
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                'SELECT * FROM solutions WHERE order_id = $1', order_id
-            )
+        cached = self._solution_cache.get(order_id)
+        if cached is not None:
+            return cached
+
+        async with self._conn() as conn:
+            row = await conn.fetchrow(_GET_SOLUTION_SQL, order_id)
             if row:
-                return Solution(**dict(row))
+                solution = _row_to_solution(row)
+                if solution.is_revealed:
+                    self._solution_cache[order_id] = solution
+                return solution
         return None
     
     # ============ Challenge Operations ============
@@ -288,52 +868,183 @@ class Database:
         if not self.pool:
             return False
         
-        async with self.pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO challenges (order_id, challenger, stake, reason,
-                                       challenge_time, resolved, challenger_won, tx_hash)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                ON CONFLICT (order_id) DO UPDATE SET
-                    resolved = EXCLUDED.resolved,
-                    challenger_won = EXCLUDED.challenger_won
-            ''', challenge.order_id, challenge.challenger, challenge.stake,
+        async with self._conn() as conn:
+            await conn.execute(
+                _INSERT_CHALLENGE_SQL,
+                challenge.order_id, challenge.challenger, challenge.stake,
                 challenge.reason, challenge.challenge_time, challenge.resolved,
                 challenge.challenger_won, challenge.tx_hash)
+
+        self._challenge_cache.pop(challenge.order_id, None)
+        self._bump('total_challenges')
         return True
     
+    async def insert_challenges(self, challenges: List[Challenge]) -> bool:
+        """Insert a batch of challenges in a single round-trip"""
+        if not self.pool or not challenges:
+            return False
+
+        async with self._conn() as conn:
+            await conn.executemany(
+                _INSERT_CHALLENGE_SQL, [_challenge_params(c) for c in challenges]
+            )
+
+        for c in challenges:
+            self._challenge_cache.pop(c.order_id, None)
+        self._bump('total_challenges', len(challenges))
+        return True
+
     async def get_challenge(self, order_id: int) -> Optional[Challenge]:
         """Get challenge by order ID"""
         if not self.pool:
             return None
         
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                'SELECT * FROM challenges WHERE order_id = $1', order_id
-            )
+        cached = self._challenge_cache.get(order_id)
+        if cached is not None:
+            return cached
+
+        async with self._conn() as conn:
+            row = await conn.fetchrow(_GET_CHALLENGE_SQL, order_id)
             if row:
-                return Challenge(**dict(row))
+                challenge = _row_to_challenge(row)
+                if challenge.resolved:
+                    self._challenge_cache[order_id] = challenge
+                return challenge
         return None
     
+    # ============ Batched Ingest ============
+
+    @asynccontextmanager
+    async def block_batch(self):
+        """Scope a whole ingest batch to one connection and transaction.
+
+        Yields a _BatchWriter whose writes share a single acquire and
+        commit (or roll back) together, so a block's events and the sync
+        cursor persist atomically.
+        """
+        if not self.pool:
+            yield _BatchWriter(None, self)
+            return
+
+        async with self._conn() as conn:
+            async with conn.transaction():
+                yield _BatchWriter(conn, self)
+
+    # ============ Sync State ============
+
+    async def get_last_processed_block(self) -> Optional[int]:
+        """Get the persisted sync cursor, if any"""
+        if not self.pool:
+            return None
+
+        async with self._conn() as conn:
+            return await conn.fetchval(_GET_LAST_BLOCK_SQL)
+
+    async def set_last_processed_block(self, block_number: int):
+        """Persist the sync cursor so restarts resume instead of re-scanning"""
+        if not self.pool:
+            return
+
+        async with self._conn() as conn:
+            await conn.execute(_SET_LAST_BLOCK_SQL, block_number)
+
     # ============ Stats ============
     
+    def _bump(self, key: str, delta: int = 1):
+        """Adjust an in-process counter once they have been seeded"""
+        if self._counts is not None:
+            self._counts[key] += delta
+
+    def _track_status_change(self, status: int, count: int = 1):
+        """Apply the counter effects of an order status transition"""
+        if status == 1:  # Accepted: leaves the open set
+            self._bump('open_orders', -count)
+        elif status == 4:  # Verified
+            self._bump('completed_orders', count)
+
+    async def _load_counts(self):
+        """Seed/refresh the counters from the authoritative SQL aggregation"""
+        async with self._conn() as conn:
+            row = await conn.fetchrow(_GET_STATS_SQL)
+        self._counts = dict(row)
+
+    async def _reconcile_counters(self):
+        """Periodically re-sync the counters so incremental drift can't accumulate"""
+        while True:
+            await asyncio.sleep(self.COUNTER_RECONCILE_INTERVAL)
+            try:
+                await self._load_counts()
+            except Exception as e:
+                logger.error(f"Failed to reconcile stat counters: {e}")
+
     async def get_stats(self) -> dict:
-        """Get protocol statistics"""
+        """Get protocol statistics from in-process counters (no table scan)"""
         if not self.pool:
             return {}
-        
-        async with self.pool.acquire() as conn:
-            total_orders = await conn.fetchval('SELECT COUNT(*) FROM orders')
-            open_orders = await conn.fetchval(
-                'SELECT COUNT(*) FROM orders WHERE status = 0'
-            )
-            completed_orders = await conn.fetchval(
-                'SELECT COUNT(*) FROM orders WHERE status = 4'
-            )
-            total_challenges = await conn.fetchval('SELECT COUNT(*) FROM challenges')
-            
-            return {
-                "total_orders": total_orders,
-                "open_orders": open_orders,
-                "completed_orders": completed_orders,
-                "total_challenges": total_challenges
-            }
+
+        if self._counts is None:
+            await self._load_counts()
+            self._reconcile_task = asyncio.create_task(self._reconcile_counters())
+
+        return dict(self._counts)
+
+
+class _BatchWriter:
+    """Batch writes bound to one connection inside an open transaction.
+
+    Mirrors the Database batch methods but never re-acquires from the
+    pool; obtained via Database.block_batch(). With no connection (mock
+    database) every write is a no-op, matching Database's behaviour.
+    """
+
+    def __init__(self, conn, db: Database):
+        self._conn = conn
+        self._db = db
+
+    async def insert_orders(self, orders: List[Order]):
+        if self._conn is None or not orders:
+            return
+        await _insert_orders_multirow(self._conn, orders)
+        for o in orders:
+            self._db._order_cache.pop(o.id, None)
+        self._db._bump('total_orders', len(orders))
+        self._db._bump('open_orders', sum(1 for o in orders if o.status == 0))
+
+    async def insert_solutions(self, solutions: List[Solution]):
+        if self._conn is None or not solutions:
+            return
+        await self._conn.executemany(
+            _INSERT_SOLUTION_SQL, [_solution_params(s) for s in solutions]
+        )
+        for s in solutions:
+            self._db._solution_cache.pop(s.order_id, None)
+
+    async def insert_challenges(self, challenges: List[Challenge]):
+        if self._conn is None or not challenges:
+            return
+        await self._conn.executemany(
+            _INSERT_CHALLENGE_SQL, [_challenge_params(c) for c in challenges]
+        )
+        for c in challenges:
+            self._db._challenge_cache.pop(c.order_id, None)
+        self._db._bump('total_challenges', len(challenges))
+
+    async def update_order_statuses(self, updates: List[tuple]):
+        if self._conn is None or not updates:
+            return
+        await self._conn.executemany(_UPDATE_ORDER_STATUS_SQL, updates)
+        for order_id, status, _ in updates:
+            self._db._order_cache.pop(order_id, None)
+            self._db._track_status_change(status)
+
+    async def reveal_solutions(self, reveals: List[tuple]):
+        if self._conn is None or not reveals:
+            return
+        await self._conn.executemany(_REVEAL_SOLUTION_SQL, reveals)
+        for order_id, _, _ in reveals:
+            self._db._solution_cache.pop(order_id, None)
+
+    async def set_last_processed_block(self, block_number: int):
+        if self._conn is None:
+            return
+        await self._conn.execute(_SET_LAST_BLOCK_SQL, block_number)
@@ -18,13 +18,36 @@ import os
 import sys
 import json
 import asyncio
+import concurrent.futures
 import threading
+import atexit
 import logging
+import logging.handlers
+import queue
 import re
 import hashlib
+import secrets
+import shelve
+import sqlite3
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
+
+import orjson
 from flask import Flask, jsonify, request
+
+try:
+    from flask_orjson import OrjsonProvider
+except ImportError:  # optional: jsonify falls back to stdlib json
+    OrjsonProvider = None
+
+try:
+    import msgpack
+except ImportError:  # optional: the binary webhook route returns 501
+    msgpack = None
 from flask_cors import CORS
 from dotenv import load_dotenv
 
@@ -36,23 +59,73 @@ from ominis_sdk import OminisSDK, Order, ProblemType, TimeTier, OrderStatus
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging. Records go through a queue so the bot thread never
+# blocks on stdout writes; a listener thread does the actual I/O.
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+# Map add_log's level strings onto stdlib levels ('success' is display-only)
+_LOG_LEVELS = {
+    'error': logging.ERROR,
+    'warning': logging.WARNING,
+    'success': logging.INFO,
+    'info': logging.INFO,
+}
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend
 
+# Route every jsonify through orjson when available, so the long tail of
+# endpoints gets the fast encoder without per-endpoint changes
+if OrjsonProvider is not None:
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
+
+
+# Bound request bodies; the largest legitimate payloads are OCR data URLs
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+
+
+def ojsonify(obj):
+    """jsonify via orjson: several times faster to encode and emits bytes
+    directly, which matters on the endpoints the frontend polls.
+    direct_passthrough hands the bytes straight to the WSGI layer without
+    another copy, which adds up on large solution payloads."""
+    return app.response_class(orjson.dumps(obj), mimetype='application/json',
+                              direct_passthrough=True)
+
+
+def _json_body() -> dict:
+    """Request body via orjson: parses the raw bytes directly, skipping
+    Werkzeug's mimetype negotiation and text decode."""
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {}
+
 # ========== Bot State ==========
 
 class BotState:
     def __init__(self):
         self.running = False
         self.sdk: Optional[OminisSDK] = None
-        self.logs = []
+        # Ring buffer: old entries fall off in O(1) instead of re-slicing the list
+        self.logs = deque(maxlen=5000)
         self.stats = {
             'orders_accepted': 0,
             'orders_solved': 0,
@@ -65,9 +138,19 @@ class BotState:
             'poll_interval': 5.0,
             'accepted_types': [0, 1, 2, 3, 4],
         }
+        # frozenset mirror of accepted_types for O(1) membership in the
+        # poll loop; refreshed whenever the config changes
+        self.accepted_types = frozenset(self.config['accepted_types'])
         self.active_orders = set()
         self.bot_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
+        # Set once the SDK is connected; waiters block on this instead of
+        # sleeping a fixed delay and hoping initialization finished
+        self.sdk_ready = threading.Event()
+        # Persistent event loop for SDK calls, shared by the bot and
+        # auto-solver threads (created lazily by run_coro)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_lock = threading.Lock()
 
     def add_log(self, message: str, level: str = 'info'):
         timestamp = datetime.now().strftime('%H:%M:%S')
@@ -77,17 +160,9 @@ class BotState:
             'level': level
         }
         self.logs.append(log_entry)
-        # Keep only last 100 logs
-        if len(self.logs) > 100:
-            self.logs = self.logs[-100:]
-        
-        # Also log to console
-        if level == 'error':
-            logger.error(message)
-        elif level == 'warning':
-            logger.warning(message)
-        else:
-            logger.info(message)
+
+        # Also log to console (enqueue only; the listener thread writes)
+        logger.log(_LOG_LEVELS.get(level, logging.INFO), message)
 
 bot_state = BotState()
 
@@ -187,6 +262,7 @@ ANSWER: [Final length/area/volume or relationship]""",
 }
 
 
+@lru_cache(maxsize=None)
 def _get_example_for_type(type_name: str) -> str:
     """Return the example block for the given type (normalized to lowercase key)."""
     key = (type_name or "").strip().lower()
@@ -201,6 +277,70 @@ STEPS:
 ANSWER: [Final answer in simplest form]"""
 
 
+# Prompt skeleton built once; solve_with_gpt only interpolates the
+# per-problem pieces
+_GPT_SYSTEM_PROMPT = "You are a math solver that shows clear step-by-step work. Always use the exact format requested with STEPS: and ANSWER: markers."
+
+_PROMPT_TEMPLATE = """You are a {type_name} expert. Solve this {type_name} problem step by step.
+
+{problem_text}
+{skill_block}
+
+Format your response EXACTLY like this (use these exact markers):
+STEPS:
+1. [First step description] => [Result of this step]
+2. [Second step description] => [Result of this step]
+3. [Continue as needed] => [Result]
+
+ANSWER: [final answer only, in the simplest form. For linear algebra: state "Unique solution" or "Inconsistent" or "Infinitely many solutions" and give the explicit solution.]
+
+{example_block}"""
+
+
+# GPT solution cache. The contract dedupes problems by hash, so repeat
+# problem texts across orders are common; identical prompts skip the API
+# round-trip entirely. In-memory dict in front of a shelve file so hits
+# survive restarts.
+SOLUTION_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'solutions.db')
+_solution_cache = {}
+_solution_cache_lock = threading.Lock()
+# Keys currently being solved: concurrent identical requests wait on the
+# first caller's event instead of issuing duplicate GPT calls
+_solution_inflight = {}
+
+
+def _solution_cache_key(problem_type: int, problem_text: str, problem_type_label: str, skill_instructions: str) -> str:
+    """Cache key over everything that shapes the GPT prompt."""
+    raw = f"{problem_type_label or problem_type}|{problem_text or ''}|{skill_instructions or ''}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _solution_cache_get(key: str) -> Optional[dict]:
+    with _solution_cache_lock:
+        cached = _solution_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            with shelve.open(SOLUTION_CACHE_FILE) as shelf:
+                cached = shelf.get(key)
+        except Exception as e:
+            logger.warning(f"Solution cache read failed: {e}")
+            return None
+        if cached is not None:
+            _solution_cache[key] = cached
+        return cached
+
+
+def _solution_cache_put(key: str, result: dict):
+    with _solution_cache_lock:
+        _solution_cache[key] = result
+        try:
+            with shelve.open(SOLUTION_CACHE_FILE) as shelf:
+                shelf[key] = result
+        except Exception as e:
+            logger.warning(f"Solution cache write failed: {e}")
+
+
 def solve_with_gpt(problem_type: int, problem_text: str = None, problem_type_label: str = None, skill_instructions: str = None) -> dict:
     """
     Solve a math problem using ChatGPT with step-by-step explanation.
@@ -218,8 +358,40 @@ def solve_with_gpt(problem_type: int, problem_text: str = None, problem_type_lab
         logger.error("No problem text provided to GPT")
         raise ValueError("No problem text provided. Cannot solve problem.")
     
+    # Repeat problems return the cached result without touching the API
+    cache_key = _solution_cache_key(problem_type, problem_text, problem_type_label, skill_instructions)
+    cached = _solution_cache_get(cache_key)
+    if cached is not None:
+        logger.info(f"Solution cache hit for problem type {problem_type}")
+        return cached
+
+    # Single-flight: if another thread is already solving this exact
+    # prompt, wait for it and reuse its result
+    while True:
+        with _solution_cache_lock:
+            event = _solution_inflight.get(cache_key)
+            if event is None:
+                event = _solution_inflight[cache_key] = threading.Event()
+                break
+        event.wait()
+        cached = _solution_cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Solution cache hit after in-flight wait")
+            return cached
+        # The in-flight call failed; fall through and try ourselves
+
+    try:
+        return _solve_with_gpt_uncached(client, cache_key, problem_type, problem_text, problem_type_label, skill_instructions)
+    finally:
+        with _solution_cache_lock:
+            _solution_inflight.pop(cache_key, None)
+        event.set()
+
+
+def _solve_with_gpt_uncached(client, cache_key: str, problem_type: int, problem_text: str, problem_type_label: str, skill_instructions: str) -> dict:
+    """Issue the actual GPT call and populate the cache."""
     type_name = (problem_type_label or "").strip() or PROBLEM_TYPE_NAMES.get(problem_type, "math")
-    
+
     skill_block = ""
     if (skill_instructions or "").strip():
         skill_block = f"""
@@ -227,114 +399,512 @@ def solve_with_gpt(problem_type: int, problem_text: str = None, problem_type_lab
 Additional instructions (user skill / preferences):
 {skill_instructions.strip()}"""
 
-    example_block = _get_example_for_type(type_name)
-
-    prompt = f"""You are a {type_name} expert. Solve this {type_name} problem step by step.
-
-{problem_text}
-{skill_block}
-
-Format your response EXACTLY like this (use these exact markers):
-STEPS:
-1. [First step description] => [Result of this step]
-2. [Second step description] => [Result of this step]
-3. [Continue as needed] => [Result]
-
-ANSWER: [final answer only, in the simplest form. For linear algebra: state "Unique solution" or "Inconsistent" or "Infinitely many solutions" and give the explicit solution.]
-
-{example_block}"""
+    prompt = _PROMPT_TEMPLATE.format(
+        type_name=type_name,
+        problem_text=problem_text,
+        skill_block=skill_block,
+        example_block=_get_example_for_type(type_name)
+    )
 
     try:
-        response = client.chat.completions.create(
+        stream = client.chat.completions.create(
             model="gpt-4o-mini",  # Fast and cheap
             messages=[
-                {"role": "system", "content": "You are a math solver that shows clear step-by-step work. Always use the exact format requested with STEPS: and ANSWER: markers."},
+                {"role": "system", "content": _GPT_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             max_tokens=500,
-            temperature=0.1
+            temperature=0.1,
+            stream=True
         )
-        content = response.choices[0].message.content.strip()
+
+        # Consume incrementally: once a complete ANSWER paragraph has
+        # arrived the parser has everything it needs, so close the stream
+        # and drop any trailing tokens instead of paying for them
+        acc = ''
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            acc += delta
+            answer_at = acc.find('ANSWER:')
+            if answer_at != -1 and '\n\n' in acc[answer_at:]:
+                stream.close()
+                break
+
+        content = acc.strip()
         logger.info(f"GPT response ({len(content)} chars): {content[:500]}...")
         
         # Parse the response
         result = parse_gpt_solution(content)
         logger.info(f"Parsed: steps={len(result['steps'])}, answer ({len(result['answer'])} chars):")
         logger.info(f"  ANSWER: {result['answer'][:300]}{'...' if len(result['answer']) > 300 else ''}")
+        _solution_cache_put(cache_key, result)
         return result
     except Exception as e:
         logger.error(f"GPT error: {e}")
         raise
 
 
+# Compiled once: parse_gpt_solution runs on every GPT response, so skip
+# the per-call re-cache probe and flag handling
+_ANSWER_RE = re.compile(r'ANSWER:\s*([\s\S]*)', re.IGNORECASE)
+_STEPS_RE = re.compile(r'STEPS:\s*\n([\s\S]*?)(?:ANSWER:|$)', re.IGNORECASE)
+_STEP_LINE_RE = re.compile(r'^\d+\.\s*(.+)', re.MULTILINE)
+
+
 def parse_gpt_solution(content: str) -> dict:
     """Parse GPT response into answer and steps."""
     result = {'answer': '', 'steps': []}
-    
+
     # Extract answer: capture everything after ANSWER: to end of content (multi-line / LaTeX safe)
-    answer_match = re.search(r'ANSWER:\s*([\s\S]*)', content, re.IGNORECASE)
+    answer_match = _ANSWER_RE.search(content)
     if answer_match:
         result['answer'] = answer_match.group(1).strip()
     else:
         # Fallback: use last line or whole content
         lines = [l.strip() for l in content.split('\n') if l.strip()]
         result['answer'] = lines[-1] if lines else content
-    
+
     # Extract steps
-    steps_match = re.search(r'STEPS:\s*\n([\s\S]*?)(?:ANSWER:|$)', content, re.IGNORECASE)
+    steps_match = _STEPS_RE.search(content)
     if steps_match:
         steps_text = steps_match.group(1).strip()
-        step_lines = re.findall(r'^\d+\.\s*(.+)', steps_text, re.MULTILINE)
-        
+        step_lines = _STEP_LINE_RE.findall(steps_text)
+
         for i, step_line in enumerate(step_lines):
-            # Parse "description => result" format
-            if '=>' in step_line:
-                parts = step_line.split('=>', 1)
-                step_content = parts[0].strip()
-                step_result = parts[1].strip() if len(parts) > 1 else ''
-            else:
-                step_content = step_line.strip()
-                step_result = ''
-            
+            # Parse "description => result" format (partition: one scan, no list)
+            step_content, _, step_result = step_line.partition('=>')
+
             result['steps'].append({
                 'step': i + 1,
-                'content': step_content,
-                'result': step_result
+                'content': step_content.strip(),
+                'result': step_result.strip()
             })
-    
+
     return result
 
+# ========== Static Answer Table ==========
+# Canonical textbook problems (derivative of x^2, the sum-of-k formula,
+# ...) recur constantly and have deterministic answers; serve those from
+# a pre-solved table and save the GPT round-trip entirely.
+
+STATIC_ANSWERS_FILE = os.path.join(os.path.dirname(__file__), 'static_answers.json')
+
+# Unicode spellings frontends commonly produce for the same math
+_CANONICAL_CHARS = str.maketrans({
+    '²': '^2',
+    '³': '^3',
+    '−': '-',
+    '×': '*',
+    '∫': '',
+})
+
+
+def _normalize_problem_text(text: str) -> str:
+    """Canonical lookup form: lowercase, unicode folded, whitespace collapsed."""
+    return ' '.join(text.translate(_CANONICAL_CHARS).lower().split())
+
+
+def _load_static_answers() -> dict:
+    """Build {(problem_type, normalized_text): solution} from the JSON table."""
+    if not os.path.exists(STATIC_ANSWERS_FILE):
+        return {}
+    try:
+        with open(STATIC_ANSWERS_FILE, 'r') as f:
+            entries = json.load(f)
+        return {
+            (entry['problem_type'], _normalize_problem_text(entry['text'])): {
+                'answer': entry['answer'],
+                'steps': entry.get('steps', [])
+            }
+            for entry in entries
+        }
+    except Exception as e:
+        logger.error(f"Failed to load static answers: {e}")
+        return {}
+
+
+_STATIC_ANSWERS = _load_static_answers()
+logger.info(f"Loaded {len(_STATIC_ANSWERS)} static answers")
+
+# Solved results indexed by problem hash; seeded from solution_storage
+# once it loads and kept current by store_solution_data
+_solved_by_hash = {}
+
+
 def solve_problem(problem_type: int, problem_hash: str, problem_text: str = None, problem_type_label: str = None, skill_instructions: str = None) -> dict:
     """
-    Main solve function - uses GPT to solve.
+    Main solve function - static answer table first, then GPT.
     Returns dict with 'answer' and 'steps'.
     Raises ValueError if GPT is not available or problem text is missing.
     problem_type_label: optional string for GPT prompt; if not set, uses PROBLEM_TYPE_NAMES[problem_type].
     skill_instructions: optional user instructions appended to the GPT prompt.
     """
+    # Known canonical problems need no model call (and no API key)
+    if problem_text and not skill_instructions:
+        static = _STATIC_ANSWERS.get((problem_type, _normalize_problem_text(problem_text)))
+        if static is not None:
+            logger.info(f"Static answer hit for problem type {problem_type}")
+            return static
+
+    # The chain dedupes problems by hash, so a hash solved for an earlier
+    # order can reuse the stored result — even when the text was never
+    # pushed to problem_storage
+    if problem_hash and not skill_instructions:
+        solved = _solved_by_hash.get(problem_hash)
+        if solved is not None:
+            logger.info(f"Reusing stored solution for hash {problem_hash[:18]}...")
+            return solved
+
     # Require GPT - no fallback
     if not os.getenv('OPENAI_API_KEY'):
         raise ValueError("OpenAI API key not configured. Cannot solve problem.")
-    
+
     return solve_with_gpt(problem_type, problem_text, problem_type_label, skill_instructions)
 
 # ========== Bot Logic ==========
 
+def _ensure_bot_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, creating it (in a daemon thread) if needed.
+
+    Previously every poll cycle built and tore down its own loop; one
+    long-lived loop amortizes selector setup and keeps connection state warm.
+    """
+    with bot_state.loop_lock:
+        if bot_state.loop is None:
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def _run():
+                # Signal from inside the loop so the creator publishes it
+                # only once run_forever is actually processing callbacks;
+                # is_running() stays False until then, and re-checking it
+                # here used to spawn a second loop and orphan the first
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            threading.Thread(target=_run, daemon=True).start()
+            started.wait()
+            bot_state.loop = loop
+        return bot_state.loop
+
+
+def run_coro(coro, timeout=None):
+    """Run a coroutine on the shared loop and block for its result.
+
+    HTTP handlers should pass a timeout (seconds) so a request can't
+    hang behind long chain activity on the shared loop; on expiry the
+    coroutine is cancelled and the TimeoutError propagates.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _ensure_bot_loop())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+async def offload(coro):
+    """Await an SDK coroutine on a worker thread.
+
+    The SDK's methods are async in signature but block internally
+    (eth_call round-trips, receipt waits of up to 120s), so awaiting
+    them directly pins the shared loop and serializes every run_coro
+    caller behind them. asyncio.run on an executor thread gives each
+    call a private throwaway loop off the shared one.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, asyncio.run, coro)
+
+
+# Shared head-block cursor: every poller asks for the chain head each
+# cycle; one cached eth_blockNumber per short interval serves them all
+_HEAD_BLOCK_TTL = 2.0
+_head_block_lock = threading.Lock()
+_head_block = (0.0, 0)
+
+
+def current_block(w3, ttl: float = _HEAD_BLOCK_TTL) -> int:
+    """eth_blockNumber with a short shared TTL across polling threads."""
+    global _head_block
+    now = time.monotonic()
+    with _head_block_lock:
+        ts, num = _head_block
+        if now - ts < ttl:
+            return num
+    num = w3.eth.block_number
+    with _head_block_lock:
+        _head_block = (now, num)
+    return num
+
+
+# Short-lived order snapshots: processing one order issues several
+# get_order round-trips within a couple of seconds, and the chain state
+# cannot change between them faster than the TTL. Bounded: entries for
+# orders that are inspected but never processed have no invalidation
+# path, so the LRU cap is what keeps per-order memory flat
+_ORDER_CACHE_TTL = 2.0
+_ORDER_CACHE_MAX = 512
+_order_cache = OrderedDict()
+
+
+async def cached_get_order(sdk, order_id: int, ttl: float = _ORDER_CACHE_TTL):
+    """get_order with a short TTL so back-to-back reads share one RPC."""
+    now = time.monotonic()
+    entry = _order_cache.get(order_id)
+    if entry and now - entry[0] < ttl:
+        return entry[1]
+    order = await sdk.get_order(order_id)
+    _order_cache[order_id] = (now, order)
+    _order_cache.move_to_end(order_id)
+    while len(_order_cache) > _ORDER_CACHE_MAX:
+        _order_cache.popitem(last=False)
+    return order
+
+
+def _invalidate_order_cache(order_id: int):
+    """Drop the snapshot after a state-changing tx (commit/reveal/accept)."""
+    _order_cache.pop(order_id, None)
+
+
+async def _wait_committed(sdk, order_id: int) -> bool:
+    """Poll until the order shows COMMITTED, backing off 1 -> 3 s per check.
+
+    Replaces the fixed 5 x 3 s retry wait; confirmation typically lands
+    within the first one or two checks.
+    """
+    for delay in (1, 2, 3, 3, 3):
+        await asyncio.sleep(delay)
+        order = await sdk.get_order(order_id)
+        if order.status.name == 'COMMITTED':
+            return True
+    return False
+
+
+# Short display ids show up in every per-order log line; memoize the
+# slice since the set of addresses seen (issuers + the bot itself) is tiny
+@lru_cache(maxsize=1024)
+def _short_id(address: str) -> str:
+    return address[:10]
+
+
+# Same rationale for case-folding: every poll lowercases the bot address
+# and each order's issuer just to compare them
+@lru_cache(maxsize=1024)
+def _lower_addr(address: str) -> str:
+    return address.lower()
+
+
+@lru_cache(maxsize=4096)
+def _norm_hash(raw: str) -> str:
+    """Canonical problem hash: lowercase with a single 0x prefix.
+
+    Replaces the old "'0x' + raw.replace('0x', '')" pattern, which
+    stripped *every* 0x substring from the hex body and could collide
+    distinct hashes onto one storage key.
+    """
+    h = raw.lower()
+    return h if h.startswith('0x') else '0x' + h
+
+
+def _normalized_hash(order) -> str:
+    """0x-prefixed problem hash for storage lookups.
+
+    bytes.hex() is always lowercase with no prefix, so a single concat
+    replaces the old hex/lower/startswith/concat chain.
+    """
+    return '0x' + order.problem_hash.hex()
+
+
+def _skip_reason(order, sdk) -> Optional[str]:
+    """Single eligibility predicate: reason string if skipped, None if eligible.
+
+    Each check returns immediately; no log strings are built here, so a
+    rejected order costs a few comparisons and nothing else.
+    """
+    if order.id in bot_state.active_orders:
+        return 'Already processing'
+    if _lower_addr(order.issuer) == _lower_addr(sdk.address):
+        return 'Own order'
+    if order.problem_type.value not in bot_state.accepted_types:
+        return f'Type {order.problem_type.name} not accepted'
+    if order.time_remaining < 60:
+        return f'Only {order.time_remaining}s remaining'
+    # Solution may already exist (webhook might have handled it)
+    if str(order.id) in solution_storage:
+        return 'Already has solution'
+    return None
+
+
+async def _process_order(sdk, order, sem: asyncio.Semaphore):
+    """Accept, solve, and submit one order (bounded by the semaphore).
+
+    Progress notes are buffered and emitted as one log record per order
+    in the finally block; only errors and warnings surface immediately.
+    """
+    events = []
+
+    def note(message: str, level: str = 'info'):
+        if level in ('error', 'warning'):
+            bot_state.add_log(message, level)
+        events.append(message)
+
+    async with sem:
+        if bot_state.stop_event.is_set():
+            return
+
+        note(f'Processing order #{order.id} ({order.problem_type.name})')
+        bot_state.active_orders.add(order.id)
+
+        try:
+            # Step 1: Accept
+            if bot_state.config['auto_accept']:
+                # Chain calls block internally (receipt waits); offload
+                # so sibling orders and other run_coro callers progress
+                receipt = await offload(sdk.accept_order(order.id))
+                _invalidate_order_cache(order.id)
+                if receipt.success:
+                    note(f'Order #{order.id} accepted!')
+                    bot_state.stats['orders_accepted'] += 1
+                else:
+                    note(f'Failed to accept order #{order.id}', 'error')
+                    return
+
+            # Step 2: Solve
+            if bot_state.config['auto_solve']:
+                # Try to get problem text from storage (normalized 0x form)
+                problem_hash = _normalized_hash(order)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    note(f'Looking for hash {problem_hash[:18]}... in {len(problem_storage)} problems: {list(islice(problem_storage, 3))}')
+
+                stored = problem_storage.get(problem_hash)
+                problem_text = stored.get('text') if stored else None
+                problem_type_label = stored.get('type_label') if stored else None
+                skill_instructions = stored.get('skill_instructions') if stored else None
+
+                if problem_text:
+                    note(f'Found problem: {problem_text[:50]}...')
+                else:
+                    note(f'Problem text NOT FOUND for hash {problem_hash[:18]}', 'warning')
+
+                # GPT call blocks; run it in the executor so sibling
+                # orders keep progressing on the shared loop
+                solution_data = await asyncio.get_running_loop().run_in_executor(
+                    None, solve_problem, order.problem_type.value, problem_hash,
+                    problem_text, problem_type_label, skill_instructions
+                )
+                solution = solution_data['answer']
+                steps = solution_data.get('steps', [])
+                note(f'Solution: {solution} ({len(steps)} steps)')
+
+                # Store solution with steps for frontend
+                store_solution_data(order.id, problem_hash, solution_data)
+
+                # Step 3: Submit (commit + reveal)
+                # Re-check order status before submitting
+                fresh_order = await cached_get_order(sdk, order.id)
+                note(f'Order status: {fresh_order.status.name}, time left: {fresh_order.time_remaining}s, solver: {_short_id(fresh_order.solver)}...')
+
+                if fresh_order.time_remaining < 30:
+                    note(f'WARNING: Only {fresh_order.time_remaining}s left!', 'warning')
+
+                if _lower_addr(fresh_order.solver) != _lower_addr(sdk.address):
+                    note(f'ERROR: Someone else accepted! Solver={_short_id(fresh_order.solver)}... but we are {_short_id(sdk.address)}...', 'error')
+                    return
+
+                # Check if already committed
+                if fresh_order.status.name == 'COMMITTED':
+                    note(f'Order already committed, need salt to reveal (skipping)', 'warning')
+                    return
+
+                # Generate salt and commit manually (so we can retry reveal)
+                salt = secrets.token_bytes(32)
+
+                try:
+                    commit_receipt = await offload(sdk.commit_solution(order.id, solution, salt))
+                    _invalidate_order_cache(order.id)
+
+                    note(f'Commit TX: {commit_receipt.tx_hash}')
+
+                    # Check commit status with retries (blockchain propagation can be slow)
+                    committed = commit_receipt.success
+                    if not committed:
+                        note(f'Commit receipt shows failure, polling for confirmation...', 'warning')
+                        committed = await _wait_committed(sdk, order.id)
+                        if committed:
+                            note(f'Order is COMMITTED! Proceeding to reveal...')
+                        else:
+                            note(f'Commit failed after retries. Check TX on Etherscan: {commit_receipt.tx_hash}', 'error')
+                            return
+                    else:
+                        note(f'Commit SUCCESS!')
+                        # Wait a bit for state to propagate
+                        await asyncio.sleep(3)
+
+                    reveal_receipt = await offload(sdk.reveal_solution(order.id, solution, salt))
+                    _invalidate_order_cache(order.id)
+
+                    if reveal_receipt.success:
+                        note(f'Order #{order.id} SOLVED! TX: {reveal_receipt.tx_hash[:16]}...')
+                        bot_state.stats['orders_solved'] += 1
+                        bot_state.stats['total_earned'] += order.reward_in_usdc()
+                    else:
+                        note(f'Reveal failed! TX: {reveal_receipt.tx_hash[:16]}...', 'error')
+
+                except Exception as submit_err:
+                    note(f'Submit error: {submit_err}', 'error')
+                    # Check final order status
+                    try:
+                        final_order = await cached_get_order(sdk, order.id)
+                        note(f'Final order status: {final_order.status.name}')
+                    except:
+                        pass
+
+        except Exception as e:
+            note(f'Error processing order #{order.id}: {e}', 'error')
+
+        finally:
+            bot_state.active_orders.discard(order.id)
+            # One structured record for the whole lifecycle
+            bot_state.add_log('[BOT] ' + '\n  '.join(events), 'info')
+
+
+async def _poll_cycle(sdk, sem: asyncio.Semaphore):
+    """One poll: fetch open orders and run the eligible ones concurrently."""
+    orders = await sdk.get_open_orders(limit=20)
+    bot_state.add_log(f'[BOT] Found {len(orders)} open orders', 'info')
+
+    debug = logger.isEnabledFor(logging.DEBUG)
+    eligible = []
+    for order in orders:
+        reason = _skip_reason(order, sdk)
+        if reason is None:
+            eligible.append(order)
+        elif debug:
+            bot_state.add_log(f'[BOT] Order #{order.id}: {reason}, skip', 'info')
+
+    if eligible:
+        await asyncio.gather(*(_process_order(sdk, o, sem) for o in eligible))
+
+
 def bot_loop():
     """Main bot loop running in a separate thread"""
     bot_state.add_log('[BOT] Starting bot loop...', 'info')
-    
+
     # Initialize SDK
     private_key = os.getenv('PRIVATE_KEY')
     rpc_url = os.getenv('RPC_URL')
     core_address = os.getenv('CORE_ADDRESS')
     orderbook_address = os.getenv('ORDERBOOK_ADDRESS')
-    
+
     if not all([private_key, rpc_url, core_address]):
         bot_state.add_log('[BOT] Missing environment variables!', 'error')
         bot_state.running = False
         return
-    
+
     try:
         sdk = OminisSDK(
             private_key=private_key,
@@ -343,197 +913,31 @@ def bot_loop():
         )
         if orderbook_address:
             sdk.set_orderbook_address(orderbook_address)
-        
+
         bot_state.sdk = sdk
+        bot_state.sdk_ready.set()
         bot_state.add_log(f'[BOT] Connected! Address: {sdk.address}', 'success')
         bot_state.add_log(f'[BOT] ETH Balance: {sdk.get_balance_eth():.4f}', 'info')
-        
+
     except Exception as e:
         bot_state.add_log(f'[BOT] Failed to initialize SDK: {e}', 'error')
         bot_state.running = False
         return
-    
+
+    # Bound concurrent commit/reveal flows at the advertised limit;
+    # orders within one poll overlap their RPC waits instead of queuing
+    sem = asyncio.Semaphore(bot_state.config['max_concurrent'])
+
     # Main loop
     while not bot_state.stop_event.is_set():
         try:
-            # Run async operations in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Get open orders
-            orders = loop.run_until_complete(sdk.get_open_orders(limit=20))
-            bot_state.add_log(f'[BOT] Found {len(orders)} open orders', 'info')
-            
-            # Find eligible order
-            for order in orders:
-                if bot_state.stop_event.is_set():
-                    break
-                    
-                # Skip if already processing
-                if order.id in bot_state.active_orders:
-                    bot_state.add_log(f'[BOT] Order #{order.id}: Already processing, skip', 'info')
-                    continue
-                
-                # Skip own orders
-                if order.issuer.lower() == sdk.address.lower():
-                    bot_state.add_log(f'[BOT] Order #{order.id}: Own order (issuer={order.issuer[:10]}... == bot={sdk.address[:10]}...), skip', 'info')
-                    continue
-                else:
-                    bot_state.add_log(f'[BOT] Order #{order.id}: Different issuer (issuer={order.issuer[:10]}... != bot={sdk.address[:10]}...), OK', 'info')
-                
-                # Check type filter
-                if order.problem_type.value not in bot_state.config['accepted_types']:
-                    bot_state.add_log(f'[BOT] Order #{order.id}: Type {order.problem_type.name} not accepted, skip', 'info')
-                    continue
-                
-                # Check concurrent limit
-                if len(bot_state.active_orders) >= bot_state.config['max_concurrent']:
-                    bot_state.add_log(f'[BOT] Order #{order.id}: Concurrent limit reached, skip', 'info')
-                    continue
-                
-                # Check time remaining
-                if order.time_remaining < 60:
-                    bot_state.add_log(f'[BOT] Order #{order.id}: Only {order.time_remaining}s remaining, skip', 'info')
-                    continue
-                
-                # Process this order
-                # Check if solution already exists (webhook might have handled it)
-                if str(order.id) in solution_storage:
-                    bot_state.add_log(f'[BOT] Order #{order.id} already has solution, skipping', 'info')
-                    continue
-                
-                bot_state.add_log(f'[BOT] Processing order #{order.id} ({order.problem_type.name})', 'info')
-                bot_state.active_orders.add(order.id)
-                
-                try:
-                    # Step 1: Accept
-                    if bot_state.config['auto_accept']:
-                        bot_state.add_log(f'[BOT] Accepting order #{order.id}...', 'info')
-                        receipt = loop.run_until_complete(sdk.accept_order(order.id))
-                        if receipt.success:
-                            bot_state.add_log(f'[BOT] Order #{order.id} accepted!', 'success')
-                            bot_state.stats['orders_accepted'] += 1
-                        else:
-                            bot_state.add_log(f'[BOT] Failed to accept order #{order.id}', 'error')
-                            continue
-                    
-                    # Step 2: Solve
-                    if bot_state.config['auto_solve']:
-                        # Try to get problem text from storage (normalize to 0x prefix)
-                        raw_hash = order.problem_hash.hex().lower()
-                        problem_hash = '0x' + raw_hash if not raw_hash.startswith('0x') else raw_hash
-                        
-                        # Debug: show what we're looking for
-                        bot_state.add_log(f'[BOT] Looking for hash: {problem_hash[:18]}...', 'info')
-                        bot_state.add_log(f'[BOT] Storage has {len(problem_storage)} problems: {list(problem_storage.keys())[:3]}', 'info')
-                        
-                        problem_text = None
-                        problem_type_label = None
-                        skill_instructions = None
-                        if problem_hash in problem_storage:
-                            stored = problem_storage[problem_hash]
-                            problem_text = stored.get('text')
-                            problem_type_label = stored.get('type_label')
-                            skill_instructions = stored.get('skill_instructions')
-                        
-                        if problem_text:
-                            bot_state.add_log(f'[BOT] Found problem: {problem_text[:50]}...', 'info')
-                        else:
-                            bot_state.add_log(f'[BOT] Problem text NOT FOUND for hash {problem_hash[:18]}', 'warning')
-                        
-                        bot_state.add_log('[BOT] Solving with GPT...', 'info')
-                        solution_data = solve_problem(order.problem_type.value, problem_hash, problem_text, problem_type_label, skill_instructions)
-                        solution = solution_data['answer']
-                        steps = solution_data.get('steps', [])
-                        bot_state.add_log(f'[BOT] Solution: {solution} ({len(steps)} steps)', 'success')
-                        
-                        # Store solution with steps for frontend
-                        store_solution_data(order.id, problem_hash, solution_data)
-                        
-                        # Step 3: Submit (commit + reveal)
-                        # Re-check order status before submitting
-                        fresh_order = loop.run_until_complete(sdk.get_order(order.id))
-                        bot_state.add_log(f'[BOT] Order status: {fresh_order.status.name}, time left: {fresh_order.time_remaining}s, solver: {fresh_order.solver[:10]}...', 'info')
-                        
-                        if fresh_order.time_remaining < 30:
-                            bot_state.add_log(f'[BOT] WARNING: Only {fresh_order.time_remaining}s left!', 'warning')
-                        
-                        if fresh_order.solver.lower() != sdk.address.lower():
-                            bot_state.add_log(f'[BOT] ERROR: Someone else accepted! Solver={fresh_order.solver[:10]}... but we are {sdk.address[:10]}...', 'error')
-                            continue
-                        
-                        # Check if already committed
-                        if fresh_order.status.name == 'COMMITTED':
-                            bot_state.add_log(f'[BOT] Order already committed, need salt to reveal (skipping)', 'warning')
-                            continue
-                        
-                        # Generate salt and commit manually (so we can retry reveal)
-                        salt = os.urandom(32)
-                        
-                        bot_state.add_log(f'[BOT] Step 1: Committing solution...', 'info')
-                        try:
-                            commit_receipt = loop.run_until_complete(
-                                sdk.commit_solution(order.id, solution, salt)
-                            )
-                            
-                            bot_state.add_log(f'[BOT] Commit TX: {commit_receipt.tx_hash}', 'info')
-                            
-                            # Check commit status with retries (blockchain propagation can be slow)
-                            committed = commit_receipt.success
-                            if not committed:
-                                bot_state.add_log(f'[BOT] Commit receipt shows failure, waiting and checking...', 'warning')
-                                for retry in range(5):
-                                    loop.run_until_complete(asyncio.sleep(3))
-                                    check_order = loop.run_until_complete(sdk.get_order(order.id))
-                                    bot_state.add_log(f'[BOT] Retry {retry+1}/5: Order status = {check_order.status.name}', 'info')
-                                    if check_order.status.name == 'COMMITTED':
-                                        committed = True
-                                        bot_state.add_log(f'[BOT] Order is COMMITTED! Proceeding to reveal...', 'success')
-                                        break
-                                
-                                if not committed:
-                                    bot_state.add_log(f'[BOT] Commit failed after retries. Check TX on Etherscan: {commit_receipt.tx_hash}', 'error')
-                                    continue
-                            else:
-                                bot_state.add_log(f'[BOT] Commit SUCCESS!', 'success')
-                                # Wait a bit for state to propagate
-                                loop.run_until_complete(asyncio.sleep(3))
-                            
-                            bot_state.add_log(f'[BOT] Step 2: Revealing solution...', 'info')
-                            reveal_receipt = loop.run_until_complete(
-                                sdk.reveal_solution(order.id, solution, salt)
-                            )
-                            
-                            if reveal_receipt.success:
-                                bot_state.add_log(f'[BOT] Order #{order.id} SOLVED! TX: {reveal_receipt.tx_hash[:16]}...', 'success')
-                                bot_state.stats['orders_solved'] += 1
-                                bot_state.stats['total_earned'] += order.reward_in_usdc()
-                            else:
-                                bot_state.add_log(f'[BOT] Reveal failed! TX: {reveal_receipt.tx_hash[:16]}...', 'error')
-                                
-                        except Exception as submit_err:
-                            bot_state.add_log(f'[BOT] Submit error: {submit_err}', 'error')
-                            # Check final order status
-                            try:
-                                final_order = loop.run_until_complete(sdk.get_order(order.id))
-                                bot_state.add_log(f'[BOT] Final order status: {final_order.status.name}', 'info')
-                            except:
-                                pass
-                
-                except Exception as e:
-                    bot_state.add_log(f'[BOT] Error processing order #{order.id}: {e}', 'error')
-                
-                finally:
-                    bot_state.active_orders.discard(order.id)
-            
-            loop.close()
-            
+            run_coro(_poll_cycle(sdk, sem))
         except Exception as e:
             bot_state.add_log(f'[BOT] Error in main loop: {e}', 'error')
-        
+
         # Wait before next iteration
         bot_state.stop_event.wait(bot_state.config['poll_interval'])
-    
+
     bot_state.add_log('[BOT] Bot stopped.', 'warning')
     bot_state.running = False
 
@@ -572,11 +976,23 @@ class AutoSolver:
     to call acceptOrder. The bot just needs to commit and reveal the solution.
     """
     
+    # Cap on remembered order ids so a long-running bot stays bounded
+    PROCESSED_ORDERS_MAX = 10_000
+
     def __init__(self, sdk, bot_state_ref):
         self.sdk = sdk
         self.bot_state = bot_state_ref
         self.bot_address = sdk.address
-        self.processed_orders = set()
+        # Lowercased once; check_order_needs_solving compares against it
+        # for every candidate order
+        self._bot_addr_lower = sdk.address.lower()
+        # Insertion-ordered dict used as a bounded LRU: membership stays
+        # O(1) and the oldest ids fall off past PROCESSED_ORDERS_MAX.
+        # Seeded from the storage DB so a restart doesn't re-check every
+        # previously solved order against the RPC.
+        self.processed_orders = OrderedDict(
+            (oid, None) for oid in _load_processed_orders(self.PROCESSED_ORDERS_MAX)
+        )
         self.running = False
         self.w3 = sdk.w3
         
@@ -590,11 +1006,21 @@ class AutoSolver:
         else:
             self.core_contract = None
         
-        self.last_block = 0
-    
+        # Scan high-watermark, persisted so a restart resumes from where
+        # the last scan stopped instead of re-reading the trailing window
+        self.last_block = int(_load_meta('last_scanned_block', 0))
+
     def log(self, message: str, level: str = 'info'):
         """Log message through bot_state"""
         self.bot_state.add_log(f'[AUTO-SOLVER] {message}', level)
+
+    def _mark_processed(self, order_id: int):
+        """Remember an order id, evicting the oldest past the cap."""
+        self.processed_orders[order_id] = None
+        evicted = None
+        if len(self.processed_orders) > self.PROCESSED_ORDERS_MAX:
+            evicted, _ = self.processed_orders.popitem(last=False)
+        _persist_processed_order(order_id, evicted)
     
     def get_order_bot(self, order_id: int) -> str:
         """Get the bot assigned to an order"""
@@ -606,50 +1032,58 @@ class AutoSolver:
             self.log(f'Error getting order bot: {e}', 'error')
             return None
     
-    def get_assigned_orders_from_events(self, from_block: int = None) -> list:
+    def get_assigned_orders_from_events(self, from_block: int = None,
+                                        advance_watermark: bool = True) -> list:
         """
         Get orders assigned to this bot by scanning OrderAssignedToBot events.
         Returns list of order IDs assigned to this bot.
+
+        advance_watermark=True is the solver's consuming scan: it resumes
+        from the high-watermark and moves it forward. Pure readers (the
+        HTTP endpoint) pass False and get a trailing window instead, so a
+        frontend poll can't swallow a block delta the solver never saw.
         """
         if not self.core_contract:
             return []
-        
+
         try:
+            head_block = current_block(self.w3)
             if from_block is None:
-                # Get recent blocks only (last ~100 blocks)
-                current_block = self.w3.eth.block_number
-                from_block = max(0, current_block - 100)
-            
-            # Use get_logs instead of create_filter for better compatibility
-            # Get OrderAssignedToBot event signature
-            event_signature = self.core_contract.events.OrderAssignedToBot
-            
-            # Build filter for events where bot == our address (indexed parameter)
-            bot_address_padded = '0x' + self.bot_address.lower().replace('0x', '').zfill(64)
-            
-            logs = self.w3.eth.get_logs({
-                'address': self.core_contract.address,
-                'fromBlock': from_block,
-                'toBlock': 'latest',
-                'topics': [
-                    event_signature.event_abi['signature'] if hasattr(event_signature.event_abi, 'signature') else self.w3.keccak(text='OrderAssignedToBot(uint256,address,uint8)').hex(),
-                    None,  # orderId (indexed but we want all)
-                    bot_address_padded  # bot address (indexed)
-                ]
-            })
-            
-            order_ids = []
-            for log in logs:
-                # orderId is the first indexed topic (after event signature)
-                if len(log['topics']) > 1:
-                    order_id = int(log['topics'][1].hex(), 16)
-                    order_ids.append(order_id)
-            
+                if advance_watermark and self.last_block:
+                    # Resume from the high-watermark instead of re-scanning
+                    # the same trailing window every iteration
+                    from_block = self.last_block + 1
+                else:
+                    # First scan / non-consuming read: recent blocks only
+                    # (last ~100 blocks)
+                    from_block = max(0, head_block - 100)
+
+            if from_block > head_block:
+                return []
+
+            # One stateless eth_getLogs with the bot address filtered
+            # server-side via the indexed topic; web3 handles decoding.
+            # camelCase kwargs: the repo pins web3 v6 (v7 renamed these)
+            events = self.core_contract.events.OrderAssignedToBot.get_logs(
+                fromBlock=from_block,
+                toBlock=head_block,
+                argument_filters={'bot': self.bot_address}
+            )
+            if advance_watermark and head_block != self.last_block:
+                self.last_block = head_block
+                _save_meta('last_scanned_block', head_block)
+
+            order_ids = [event['args']['orderId'] for event in events]
+
             if order_ids:
                 self.log(f'Found {len(order_ids)} assigned orders from events: {order_ids}', 'info')
-            
+
             return order_ids
-            
+
+        except TypeError:
+            # A signature mismatch (e.g. a web3 API rename) is a bug, not
+            # an empty scan; surface it instead of logging-and-[] forever
+            raise
         except Exception as e:
             self.log(f'Error getting assigned orders from events: {e}', 'error')
             return []
@@ -665,14 +1099,11 @@ class AutoSolver:
                 return None
             
             # Get order details
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            order = loop.run_until_complete(self.sdk.get_order(order_id))
-            loop.close()
+            order = run_coro(cached_get_order(self.sdk, order_id))
             
             # Check if assigned to us
             assigned_bot = self.get_order_bot(order_id)
-            if not assigned_bot or assigned_bot.lower() != self.bot_address.lower():
+            if not assigned_bot or assigned_bot.lower() != self._bot_addr_lower:
                 return None
             
             # Check order status - we can solve if OPEN (subscription mode doesn't need accept)
@@ -708,21 +1139,20 @@ class AutoSolver:
         try:
             self.log(f'Solving order #{order_id} ({order.problem_type.name})...', 'info')
             
-            # Get problem hash
-            raw_hash = order.problem_hash.hex().lower()
-            problem_hash = '0x' + raw_hash if not raw_hash.startswith('0x') else raw_hash
+            # Get problem hash (normalized 0x form)
+            problem_hash = _normalized_hash(order)
             
             # Try to get problem text, type_label, skill_instructions from storage
-            problem_text = None
-            problem_type_label = None
-            skill_instructions = None
-            if problem_hash in problem_storage:
-                stored = problem_storage[problem_hash]
+            stored = problem_storage.get(problem_hash)
+            if stored:
                 problem_text = stored.get('text')
                 problem_type_label = stored.get('type_label')
                 skill_instructions = stored.get('skill_instructions')
                 self.log(f'Found problem text: {problem_text[:50]}...', 'info')
             else:
+                problem_text = None
+                problem_type_label = None
+                skill_instructions = None
                 self.log(f'Problem text not found for hash {problem_hash[:18]}...', 'warning')
             
             # Solve the problem
@@ -736,52 +1166,41 @@ class AutoSolver:
             store_solution_data(order_id, problem_hash, solution_data)
             
             # Generate salt for commit-reveal
-            salt = os.urandom(32)
-            
-            # Create async loop for blockchain operations
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                # Step 1: Commit solution
-                self.log(f'Committing solution for order #{order_id}...', 'info')
-                commit_receipt = loop.run_until_complete(
-                    self.sdk.commit_solution(order_id, solution, salt)
-                )
-                self.log(f'Commit TX: {commit_receipt.tx_hash}', 'info')
-                
-                if not commit_receipt.success:
-                    # Wait and check if commit actually succeeded
-                    for retry in range(3):
-                        loop.run_until_complete(asyncio.sleep(3))
-                        check_order = loop.run_until_complete(self.sdk.get_order(order_id))
-                        if check_order.status.name == 'COMMITTED':
-                            self.log(f'Commit confirmed after retry', 'success')
-                            break
-                    else:
-                        self.log(f'Commit failed for order #{order_id}', 'error')
-                        return False
-                
-                # Wait for commit to propagate
-                loop.run_until_complete(asyncio.sleep(3))
-                
-                # Step 2: Reveal solution
-                self.log(f'Revealing solution for order #{order_id}...', 'info')
-                reveal_receipt = loop.run_until_complete(
-                    self.sdk.reveal_solution(order_id, solution, salt)
-                )
-                
-                if reveal_receipt.success:
-                    self.log(f'Order #{order_id} SOLVED! TX: {reveal_receipt.tx_hash[:16]}...', 'success')
-                    self.bot_state.stats['orders_solved'] += 1
-                    return True
+            salt = secrets.token_bytes(32)
+
+            # Commit + reveal broadcast back-to-back with consecutive
+            # nonces: one block-wait instead of commit-wait, sleep,
+            # reveal-wait. Offloaded: the receipt waits inside would
+            # otherwise pin the shared loop for every solved order
+            self.log(f'Submitting solution for order #{order_id} (pipelined commit+reveal)...', 'info')
+            commit_receipt, reveal_receipt = run_coro(
+                offload(self.sdk.submit_solution_pipelined(order_id, solution, salt))
+            )
+            _invalidate_order_cache(order_id)
+            self.log(f'Commit TX: {commit_receipt.tx_hash}', 'info')
+
+            if not reveal_receipt.success:
+                # The reveal may have been rejected alongside a slow commit;
+                # confirm the commit landed, then retry the reveal once
+                if run_coro(_wait_committed(self.sdk, order_id)):
+                    self.log(f'Commit confirmed, retrying reveal...', 'warning')
+                    reveal_receipt = run_coro(
+                        offload(self.sdk.reveal_solution(order_id, solution, salt))
+                    )
+                    _invalidate_order_cache(order_id)
                 else:
-                    self.log(f'Reveal failed for order #{order_id}: {reveal_receipt.tx_hash}', 'error')
+                    self.log(f'Commit failed for order #{order_id}', 'error')
                     return False
-                    
-            finally:
-                loop.close()
-                
+
+            if reveal_receipt.success:
+                self.log(f'Order #{order_id} SOLVED! TX: {reveal_receipt.tx_hash[:16]}...', 'success')
+                self.bot_state.stats['orders_solved'] += 1
+                return True
+            else:
+                self.log(f'Reveal failed for order #{order_id}: {reveal_receipt.tx_hash}', 'error')
+                return False
+
+
         except Exception as e:
             self.log(f'Error solving order #{order_id}: {e}', 'error')
             return False
@@ -795,7 +1214,14 @@ class AutoSolver:
         try:
             # Get assigned orders from recent events
             order_ids = self.get_assigned_orders_from_events()
-            
+
+            # Dedupe and drop already-processed ids up front: each
+            # survivor costs an RPC in check_order_needs_solving
+            order_ids = [
+                oid for oid in dict.fromkeys(order_ids)
+                if oid not in self.processed_orders
+            ]
+
             for order_id in order_ids:
                 if not self.running:
                     break
@@ -806,7 +1232,7 @@ class AutoSolver:
                     continue
                 
                 # Mark as processing
-                self.processed_orders.add(order_id)
+                self._mark_processed(order_id)
                 self.bot_state.active_orders.add(order_id)
                 
                 try:
@@ -870,7 +1296,7 @@ def start_auto_solver():
 @app.route('/status', methods=['GET'])
 def get_status():
     """Get bot status"""
-    return jsonify({
+    return ojsonify({
         'running': bot_state.running,
         'address': bot_state.sdk.address if bot_state.sdk else None,
         'stats': bot_state.stats,
@@ -887,17 +1313,19 @@ def start_bot():
     
     bot_state.running = True
     bot_state.stop_event.clear()
-    
+    bot_state.sdk_ready.clear()
+
     # Start regular bot loop
     bot_state.bot_thread = threading.Thread(target=bot_loop, daemon=True)
     bot_state.bot_thread.start()
     
-    # Start auto-solver after a short delay (SDK needs to initialize first)
+    # Start auto-solver as soon as the SDK is connected (no fixed delay,
+    # and a slow init no longer silently skips the solver)
     def delayed_auto_solver_start():
-        import time
-        time.sleep(3)  # Wait for SDK initialization
-        if bot_state.sdk:
+        if bot_state.sdk_ready.wait(timeout=30) and bot_state.sdk:
             start_auto_solver()
+        else:
+            bot_state.add_log('[BOT] SDK not ready after 30s; auto-solver not started', 'error')
     
     auto_solver_thread = threading.Thread(target=delayed_auto_solver_start, daemon=True)
     auto_solver_thread.start()
@@ -924,8 +1352,9 @@ def stop_bot():
 def get_logs():
     """Get recent logs"""
     limit = request.args.get('limit', 50, type=int)
-    return jsonify({
-        'logs': bot_state.logs[-limit:]
+    # Snapshot first: deques don't slice, and this keeps the read atomic
+    return ojsonify({
+        'logs': list(bot_state.logs)[-limit:]
     })
 
 @app.route('/config', methods=['GET'])
@@ -941,7 +1370,8 @@ def update_config():
         for key in ['auto_accept', 'auto_solve', 'max_concurrent', 'poll_interval', 'accepted_types']:
             if key in data:
                 bot_state.config[key] = data[key]
-    
+        bot_state.accepted_types = frozenset(bot_state.config['accepted_types'])
+
     return jsonify({'success': True, 'config': bot_state.config})
 
 @app.route('/health', methods=['GET'])
@@ -1066,41 +1496,48 @@ def get_assigned_orders():
     include_processed = request.args.get('include_processed', 'false').lower() == 'true'
     
     try:
-        # Get assigned orders from events
-        order_ids = auto_solver.get_assigned_orders_from_events(from_block)
-        
+        # Get assigned orders from events. Non-consuming read: advancing
+        # the watermark here would hide these assignments from run_once
+        order_ids = auto_solver.get_assigned_orders_from_events(
+            from_block, advance_watermark=False)
+
+        # Hoisted once: the membership checks below run per order
+        processed = auto_solver.processed_orders
+
         # Filter out processed orders if requested
         if not include_processed:
-            order_ids = [oid for oid in order_ids if oid not in auto_solver.processed_orders]
-        
-        # Get order details for each
+            order_ids = [oid for oid in order_ids if oid not in processed]
+
+        # Fetch all order details concurrently: each get_order is an
+        # independent RPC, so N serial round-trips collapse to ~one.
+        # get_order blocks internally, so offload to executor threads —
+        # that's what makes the gather actually run in parallel
+        orders = run_coro(asyncio.gather(
+            *(offload(auto_solver.sdk.get_order(oid)) for oid in order_ids),
+            return_exceptions=True
+        ), timeout=30)
+
         orders_info = []
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        for order_id in order_ids:
-            try:
-                order = loop.run_until_complete(auto_solver.sdk.get_order(order_id))
+        for order_id, order in zip(order_ids, orders):
+            if isinstance(order, Exception):
                 orders_info.append({
                     'order_id': order_id,
-                    'problem_type': order.problem_type.name,
-                    'status': order.status.name,
-                    'time_remaining': order.time_remaining,
-                    'processed': order_id in auto_solver.processed_orders
+                    'error': str(order)
                 })
-            except Exception as e:
+            else:
                 orders_info.append({
                     'order_id': order_id,
-                    'error': str(e)
+                    'problem_type': order.problem_type.name,
+                    'status': order.status.name,
+                    'time_remaining': order.time_remaining,
+                    'processed': order_id in processed
                 })
-        
-        loop.close()
-        
-        return jsonify({
+
+        return ojsonify({
             'success': True,
             'bot_address': auto_solver.bot_address,
             'total_assigned': len(order_ids),
-            'total_processed': len(auto_solver.processed_orders),
+            'total_processed': len(processed),
             'orders': orders_info
         })
         
@@ -1170,17 +1607,47 @@ def get_auto_solver_status():
             'running': False
         })
     
+    # Counts only: copying the whole processed set per poll serialized
+    # O(N) ids every second; the ids themselves are paginated under
+    # /auto-solver/processed
     return jsonify({
         'success': True,
         'initialized': True,
         'running': auto_solver.running,
         'bot_address': auto_solver.bot_address,
         'processed_count': len(auto_solver.processed_orders),
-        'processed_orders': list(auto_solver.processed_orders),
         'core_contract_set': auto_solver.core_contract is not None
     })
 
 
+@app.route('/auto-solver/processed', methods=['GET'])
+def list_processed_orders():
+    """
+    Paginated processed order ids, newest first.
+
+    Query params:
+        - offset: rows to skip (default: 0)
+        - limit: page size (default: 100, max: 1000)
+    """
+    limit = min(request.args.get('limit', 100, type=int), 1000)
+    offset = request.args.get('offset', 0, type=int)
+    with _storage_db_lock:
+        total = _storage_db.execute(
+            'SELECT COUNT(*) FROM processed_orders'
+        ).fetchone()[0]
+        rows = _storage_db.execute(
+            'SELECT order_id FROM processed_orders ORDER BY order_id DESC LIMIT ? OFFSET ?',
+            (limit, offset)
+        ).fetchall()
+    return ojsonify({
+        'success': True,
+        'total': total,
+        'offset': offset,
+        'limit': limit,
+        'order_ids': [row[0] for row in rows]
+    })
+
+
 @app.route('/auto-solver/run-once', methods=['POST'])
 def run_auto_solver_once():
     """Manually trigger one iteration of the auto-solver"""
@@ -1229,16 +1696,12 @@ def solve_endpoint():
     problem_type_label = (data.get('problem_type_label') or data.get('problemTypeLabel') or '').strip() or None
     
     # Normalize hash for lookup
-    if problem_hash:
-        raw_hash = problem_hash.lower()
-        problem_hash_normalized = '0x' + raw_hash.replace('0x', '')
-    else:
-        problem_hash_normalized = ''
+    problem_hash_normalized = _norm_hash(problem_hash) if problem_hash else ''
     
     skill_instructions = (data.get('skill_instructions') or data.get('skillInstructions') or '').strip() or None
     # If no problem text provided, try to get from storage
-    if problem_hash_normalized and problem_hash_normalized in problem_storage:
-        stored = problem_storage[problem_hash_normalized]
+    stored = problem_storage.get(problem_hash_normalized) if problem_hash_normalized else None
+    if stored:
         if not problem_text:
             problem_text = stored.get('text')
         if not problem_type_label and stored.get('type_label'):
@@ -1272,27 +1735,135 @@ def solve_endpoint():
         })
 
 # ========== Problem Storage ==========
-# File-based storage for problem texts (persists across restarts)
+# SQLite-backed storage for problem texts (persists across restarts).
+# The dicts stay the in-memory source of truth so the read paths are
+# unchanged; persistence is a per-key INSERT OR REPLACE into a WAL
+# database, so each update writes a few KB instead of the whole file.
 
-PROBLEM_STORAGE_FILE = os.path.join(os.path.dirname(__file__), 'problem_storage.json')
+STORAGE_DB_FILE = os.path.join(os.path.dirname(__file__), 'storage.db')
 
-def load_problem_storage():
-    """Load problem storage from file"""
-    if os.path.exists(PROBLEM_STORAGE_FILE):
+_storage_db_lock = threading.Lock()
+_storage_db = sqlite3.connect(
+    STORAGE_DB_FILE, check_same_thread=False, isolation_level=None
+)
+_storage_db.execute('PRAGMA journal_mode=WAL')
+_storage_db.execute('PRAGMA synchronous=NORMAL')
+_storage_db.execute(
+    'CREATE TABLE IF NOT EXISTS problems (key TEXT PRIMARY KEY, data TEXT NOT NULL)'
+)
+_storage_db.execute(
+    'CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, data TEXT NOT NULL)'
+)
+_storage_db.execute(
+    'CREATE TABLE IF NOT EXISTS processed_orders (order_id INTEGER PRIMARY KEY)'
+)
+_storage_db.execute(
+    'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+)
+
+
+def _load_meta(key: str, default=None):
+    """Read one value from the meta table."""
+    with _storage_db_lock:
+        row = _storage_db.execute(
+            'SELECT value FROM meta WHERE key = ?', (key,)
+        ).fetchone()
+    return row[0] if row else default
+
+
+def _save_meta(key: str, value):
+    """Write one value to the meta table."""
+    try:
+        with _storage_db_lock:
+            _storage_db.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                (key, str(value))
+            )
+    except Exception as e:
+        logger.error(f"Failed to persist meta {key}: {e}")
+
+
+def _load_processed_orders(limit: int) -> list:
+    """Most recent processed order ids, oldest first (ids are monotonic)."""
+    with _storage_db_lock:
+        rows = _storage_db.execute(
+            'SELECT order_id FROM processed_orders ORDER BY order_id DESC LIMIT ?',
+            (limit,)
+        ).fetchall()
+    return [row[0] for row in reversed(rows)]
+
+
+def _persist_processed_order(order_id: int, evicted=None):
+    """Record a processed order id, dropping the evicted one if any."""
+    try:
+        with _storage_db_lock:
+            _storage_db.execute(
+                'INSERT OR IGNORE INTO processed_orders (order_id) VALUES (?)',
+                (order_id,)
+            )
+            if evicted is not None:
+                _storage_db.execute(
+                    'DELETE FROM processed_orders WHERE order_id = ?', (evicted,)
+                )
+    except Exception as e:
+        logger.error(f"Failed to persist processed order #{order_id}: {e}")
+
+
+def _load_store(table: str, legacy_file: str) -> dict:
+    """Load a storage table, importing the legacy JSON file once if present."""
+    with _storage_db_lock:
+        rows = _storage_db.execute(f'SELECT key, data FROM {table}').fetchall()
+    if rows:
+        return {key: json.loads(data) for key, data in rows}
+
+    # One-time migration from the old full-file JSON storage
+    if os.path.exists(legacy_file):
         try:
-            with open(PROBLEM_STORAGE_FILE, 'r') as f:
-                return json.load(f)
+            with open(legacy_file, 'r') as f:
+                data = json.load(f)
+            with _storage_db_lock:
+                _storage_db.executemany(
+                    f'INSERT OR REPLACE INTO {table} (key, data) VALUES (?, ?)',
+                    [(k, json.dumps(v, separators=(',', ':'))) for k, v in data.items()]
+                )
+            logger.info(f"Migrated {len(data)} entries from {os.path.basename(legacy_file)} into {table}")
+            return data
         except Exception as e:
-            logger.error(f"Failed to load problem storage: {e}")
+            logger.error(f"Failed to migrate {legacy_file}: {e}")
     return {}
 
-def save_problem_storage():
-    """Save problem storage to file"""
+
+def _persist_key(table: str, store: dict, key):
+    """Write one changed entry (or the whole dict when key is None).
+
+    Compact separators: these rows are only ever machine-read, so the
+    pretty-print bytes would be pure write amplification.
+    """
     try:
-        with open(PROBLEM_STORAGE_FILE, 'w') as f:
-            json.dump(problem_storage, f, indent=2)
+        with _storage_db_lock:
+            if key is None:
+                _storage_db.executemany(
+                    f'INSERT OR REPLACE INTO {table} (key, data) VALUES (?, ?)',
+                    [(k, json.dumps(v, separators=(',', ':'))) for k, v in store.items()]
+                )
+            else:
+                _storage_db.execute(
+                    f'INSERT OR REPLACE INTO {table} (key, data) VALUES (?, ?)',
+                    (key, json.dumps(store.get(key), separators=(',', ':')))
+                )
     except Exception as e:
-        logger.error(f"Failed to save problem storage: {e}")
+        logger.error(f"Failed to persist {table}: {e}")
+
+
+PROBLEM_STORAGE_FILE = os.path.join(os.path.dirname(__file__), 'problem_storage.json')
+
+def load_problem_storage():
+    """Load problem storage from the database"""
+    return _load_store('problems', PROBLEM_STORAGE_FILE)
+
+def save_problem_storage(key=None):
+    """Persist the changed problem entry"""
+    _persist_key('problems', problem_storage, key)
 
 problem_storage = load_problem_storage()  # {problem_hash: {text, type, timestamp}}
 logger.info(f"Loaded {len(problem_storage)} problems from storage")
@@ -1304,22 +1875,12 @@ logger.info(f"Loaded {len(problem_storage)} problems from storage")
 SOLUTION_STORAGE_FILE = os.path.join(os.path.dirname(__file__), 'solution_storage.json')
 
 def load_solution_storage():
-    """Load solution storage from file"""
-    if os.path.exists(SOLUTION_STORAGE_FILE):
-        try:
-            with open(SOLUTION_STORAGE_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load solution storage: {e}")
-    return {}
+    """Load solution storage from the database"""
+    return _load_store('solutions', SOLUTION_STORAGE_FILE)
 
-def save_solution_storage():
-    """Save solution storage to file"""
-    try:
-        with open(SOLUTION_STORAGE_FILE, 'w') as f:
-            json.dump(solution_storage, f, indent=2)
-    except Exception as e:
-        logger.error(f"Failed to save solution storage: {e}")
+def save_solution_storage(key=None):
+    """Persist the changed solution entry"""
+    _persist_key('solutions', solution_storage, key)
 
 def store_solution_data(order_id: int, problem_hash: str, solution_data: dict, overwrite: bool = False):
     """Store solution with steps for an order. Won't overwrite existing unless forced."""
@@ -1329,25 +1890,59 @@ def store_solution_data(order_id: int, problem_hash: str, solution_data: dict, o
     if order_key in solution_storage and not overwrite:
         logger.info(f"Solution for order #{order_id} already exists, skipping storage")
         return
-    
-    # Create a hash of the steps for verification
-    steps_str = json.dumps(solution_data.get('steps', []), sort_keys=True)
-    steps_hash = '0x' + hashlib.sha256(steps_str.encode()).hexdigest()
-    
+
+    # Create a hash of the steps for verification. On overwrites with
+    # identical steps reuse the stored hash instead of re-serializing;
+    # compact separators keep the hashed bytes minimal otherwise.
+    steps = solution_data.get('steps', [])
+    existing = solution_storage.get(order_key)
+    if existing is not None and existing.get('steps') == steps:
+        steps_hash = existing['steps_hash']
+    else:
+        steps_str = json.dumps(steps, separators=(',', ':'), sort_keys=True)
+        steps_hash = '0x' + hashlib.sha256(steps_str.encode()).hexdigest()
+
+    # A forced overwrite resets the entry to unverified; keep the
+    # incremental tally in step with that transition
+    if existing is not None:
+        _adjust_verified_count(existing.get('verified', False), False)
+
     solution_storage[str(order_id)] = {
         'order_id': order_id,
         'problem_hash': problem_hash,
         'answer': solution_data.get('answer', ''),
-        'steps': solution_data.get('steps', []),
+        'steps': steps,
         'steps_hash': steps_hash,
         'timestamp': datetime.now().isoformat(),
         'verified': False,
         'verification_status': 'pending'
     }
-    save_solution_storage()
+    save_solution_storage(order_key)
+    if problem_hash and solution_data.get('answer'):
+        _solved_by_hash[problem_hash] = {
+            'answer': solution_data['answer'],
+            'steps': steps
+        }
     logger.info(f"Stored solution for order #{order_id}: {solution_data.get('answer', '')[:30]}...")
 
+# Verified-solution tally, maintained incrementally so /bot/stats stays
+# O(1) instead of re-scanning solution_storage per poll
+_verified_count = 0
+
+
+def _adjust_verified_count(was_verified: bool, is_verified: bool):
+    global _verified_count
+    _verified_count += int(bool(is_verified)) - int(bool(was_verified))
+
+
 solution_storage = load_solution_storage()  # {order_id: {answer, steps, ...}}
+_verified_count = sum(1 for s in solution_storage.values() if s.get('verified', False))
+for _entry in solution_storage.values():
+    if _entry.get('problem_hash') and _entry.get('answer'):
+        _solved_by_hash[_entry['problem_hash']] = {
+            'answer': _entry['answer'],
+            'steps': _entry.get('steps', [])
+        }
 logger.info(f"Loaded {len(solution_storage)} solutions from storage")
 
 @app.route('/problems', methods=['POST'])
@@ -1358,8 +1953,7 @@ def store_problem():
         return jsonify({'success': False, 'error': 'Missing hash or text'})
     
     # Normalize hash: ensure 0x prefix and lowercase
-    raw_hash = data['hash'].lower()
-    problem_hash = '0x' + raw_hash.replace('0x', '') if not raw_hash.startswith('0x') else raw_hash
+    problem_hash = _norm_hash(data['hash'])
     problem_storage[problem_hash] = {
         'text': data['text'],
         'type': data.get('type', 0),
@@ -1367,8 +1961,8 @@ def store_problem():
         'skill_instructions': (data.get('skill_instructions') or data.get('skillInstructions') or '').strip() or None,
         'timestamp': datetime.now().isoformat()
     }
-    save_problem_storage()  # Persist to file
-    
+    save_problem_storage(problem_hash)  # Persist to file
+
     logger.info(f"Stored problem: {problem_hash[:18]}... = {data['text'][:50]}...")
     return jsonify({'success': True, 'hash': problem_hash})
 
@@ -1376,8 +1970,7 @@ def store_problem():
 def get_problem(problem_hash):
     """Get a problem text by hash"""
     # Normalize hash: ensure 0x prefix and lowercase
-    raw_hash = problem_hash.lower()
-    problem_hash = '0x' + raw_hash.replace('0x', '') if not raw_hash.startswith('0x') else raw_hash
+    problem_hash = _norm_hash(problem_hash)
     if problem_hash in problem_storage:
         return jsonify({
             'success': True,
@@ -1455,7 +2048,7 @@ def get_solution(order_id):
 @app.route('/solutions', methods=['GET'])
 def list_solutions():
     """List all stored solutions"""
-    return jsonify({
+    return ojsonify({
         'count': len(solution_storage),
         'solutions': {
             k: {
@@ -1480,11 +2073,13 @@ def update_verification_status(order_id):
     status = data.get('status', 'verified' if is_verified else 'failed')
     reason = data.get('reason', '')
     
-    solution_storage[order_key]['verified'] = is_verified
-    solution_storage[order_key]['verification_status'] = status
-    solution_storage[order_key]['verification_reason'] = reason
-    solution_storage[order_key]['verification_time'] = datetime.now().isoformat()
-    save_solution_storage()
+    entry = solution_storage[order_key]
+    _adjust_verified_count(entry.get('verified', False), is_verified)
+    entry['verified'] = is_verified
+    entry['verification_status'] = status
+    entry['verification_reason'] = reason
+    entry['verification_time'] = datetime.now().isoformat()
+    save_solution_storage(order_key)
     
     logger.info(f"Order #{order_id} verification: {status} - {reason}")
     
@@ -1525,6 +2120,7 @@ def init_sdk_if_needed():
             sdk.set_orderbook_address(orderbook_address)
         
         bot_state.sdk = sdk
+        bot_state.sdk_ready.set()
         logger.info(f"[WEBHOOK] SDK initialized, address: {sdk.address}")
         return sdk
     except Exception as e:
@@ -1532,32 +2128,128 @@ def init_sdk_if_needed():
         return None
 
 
-@app.route('/webhook/problem', methods=['POST'])
-def receive_problem_webhook():
-    """
-    Receive problem push from platform (Webhook mode).
-    Platform calls this when a user selects this bot.
-    
-    Immediately solves the problem and submits to chain (commit + reveal).
-    
-    Request body:
-        - order_id: int (required)
-        - problem_hash: str
-        - problem_text: str (required)
-        - problem_type: int
-        - submit_to_chain: bool (default: true)
-    
-    Returns:
-        - success: bool
-        - solution: str
-        - steps: list
-        - commit_tx: str (if submitted)
-        - reveal_tx: str (if submitted)
+# Chain submissions run on one background worker so the webhook handler
+# returns as soon as the problem is solved; clients follow progress via
+# /webhook/solution-status/<order_id>
+_chain_job_queue = queue.Queue()
+
+# Platforms retry webhooks; one solve+submit pipeline per order id. Ids
+# stay in this set until their chain job finishes (or the handler exits
+# without queueing one), so retries short-circuit to status reporting.
+_webhook_inflight = set()
+_webhook_inflight_lock = threading.Lock()
+
+# Terminal failure states where a retry POST should start over
+_RETRYABLE_WEBHOOK_STATES = frozenset({
+    'error', 'sdk_failed', 'accept_failed', 'commit_failed',
+    'reveal_failed', 'chain_error'
+})
+
+
+def _release_webhook_inflight(order_id: int):
+    with _webhook_inflight_lock:
+        _webhook_inflight.discard(order_id)
+
+
+def _submit_webhook_solution(order_id: int, solution: str, salt: bytes):
+    """Run the accept/commit/reveal sequence for a webhook-solved order."""
+    sdk = init_sdk_if_needed()
+    if not sdk:
+        logger.error(f"[WEBHOOK] SDK initialization failed!")
+        webhook_solution_status[order_id]['status'] = 'sdk_failed'
+        return
+    logger.info(f"[WEBHOOK] SDK ready: {sdk.address}")
+
+    try:
+        # Receipt-waiting chain calls go through offload() so this
+        # submission doesn't pin the shared loop for up to 120s —
+        # bot_loop's poll cycle and the HTTP run_coro callers keep moving
+        # First check order status and accept if needed
+        order = run_coro(sdk.get_order(order_id))
+        logger.info(f"[WEBHOOK] Order #{order_id} status: {order.status.name}")
+
+        if order.status.name in ['POSTED', 'ASSIGNED', 'OPEN']:
+            # Need to accept the order first
+            webhook_solution_status[order_id]['status'] = 'accepting'
+            logger.info(f"[WEBHOOK] Accepting order #{order_id}...")
+
+            accept_receipt = run_coro(offload(sdk.accept_order(order_id)))
+            logger.info(f"[WEBHOOK] Accept TX: {accept_receipt.tx_hash}, success={accept_receipt.success}")
+
+            if not accept_receipt.success:
+                # Wait and check if it succeeded anyway
+                time.sleep(2)
+                order = run_coro(sdk.get_order(order_id))
+                if order.status.name != 'ACCEPTED':
+                    webhook_solution_status[order_id]['status'] = 'accept_failed'
+                    webhook_solution_status[order_id]['error'] = f'Accept failed, status={order.status.name}'
+                    return
+
+            # Wait for accept to propagate
+            time.sleep(2)
+
+        # Commit solution
+        webhook_solution_status[order_id]['status'] = 'committing'
+        logger.info(f"[WEBHOOK] Committing solution for #{order_id}...")
+
+        commit_receipt = run_coro(offload(sdk.commit_solution(order_id, solution, salt)))
+        webhook_solution_status[order_id]['commit_tx'] = commit_receipt.tx_hash
+        logger.info(f"[WEBHOOK] Commit TX: {commit_receipt.tx_hash}")
+
+        # Wait for commit to propagate
+        logger.info(f"[WEBHOOK] Waiting 3s before reveal...")
+        time.sleep(3)
+
+        # Reveal solution
+        webhook_solution_status[order_id]['status'] = 'revealing'
+        logger.info(f"[WEBHOOK] Revealing solution for #{order_id}...")
+
+        reveal_receipt = run_coro(offload(sdk.reveal_solution(order_id, solution, salt)))
+        webhook_solution_status[order_id]['reveal_tx'] = reveal_receipt.tx_hash
+        logger.info(f"[WEBHOOK] Reveal TX: {reveal_receipt.tx_hash}")
+
+        if reveal_receipt.success:
+            webhook_solution_status[order_id]['status'] = 'completed'
+            logger.info(f"[WEBHOOK] Order #{order_id} COMPLETED!")
+            bot_state.stats['orders_solved'] += 1
+        else:
+            webhook_solution_status[order_id]['status'] = 'reveal_failed'
+            logger.error(f"[WEBHOOK] Reveal may have failed for #{order_id}")
+
+    except Exception as e:
+        logger.error(f"[WEBHOOK] Chain submission error: {e}")
+        import traceback
+        logger.error(f"[WEBHOOK] Traceback: {traceback.format_exc()}")
+        webhook_solution_status[order_id]['status'] = 'chain_error'
+        webhook_solution_status[order_id]['error'] = str(e)
+
+
+def _chain_job_worker():
+    """Drain queued chain submissions one at a time."""
+    while True:
+        order_id, solution, salt = _chain_job_queue.get()
+        try:
+            _submit_webhook_solution(order_id, solution, salt)
+        except Exception as e:
+            logger.error(f"[WEBHOOK] Chain worker error for #{order_id}: {e}")
+        finally:
+            _release_webhook_inflight(order_id)
+            _chain_job_queue.task_done()
+
+
+threading.Thread(target=_chain_job_worker, daemon=True).start()
+
+
+def _handle_problem_webhook(data):
+    """Transport-agnostic core of the problem webhook.
+
+    Shared by the JSON and MessagePack routes; returns a plain payload
+    dict plus the HTTP status code so each route can encode it in its
+    own wire format.
     """
-    data = request.get_json()
     if not data:
-        return jsonify({'success': False, 'error': 'No data provided'})
-    
+        return {'success': False, 'error': 'No data provided'}, 200
+
     order_id = data.get('order_id')
     problem_hash = data.get('problem_hash', '')
     problem_text = data.get('problem_text', '')
@@ -1573,17 +2265,34 @@ def receive_problem_webhook():
     logger.info(f"[WEBHOOK] Received problem #{order_id} (type={problem_type}, submit={submit_to_chain}, raw={submit_to_chain_raw})")
     
     if not problem_text:
-        return jsonify({
+        return {
             'success': False,
             'error': 'Problem text required'
-        })
-    
+        }, 200
+
     if order_id is None:
-        return jsonify({
+        return {
             'success': False,
             'error': 'order_id required'
-        })
-    
+        }, 200
+
+    # Single-flight: a duplicate POST for an order already being solved
+    # or submitted must not trigger a second GPT call or chain tx
+    with _webhook_inflight_lock:
+        existing = webhook_solution_status.get(order_id)
+        if order_id in _webhook_inflight or (
+            existing and existing.get('status') not in _RETRYABLE_WEBHOOK_STATES
+        ):
+            logger.info(f"[WEBHOOK] Duplicate submission for #{order_id}, reporting status")
+            return {
+                'success': True,
+                'order_id': order_id,
+                'duplicate': True,
+                'status': (existing or {}).get('status', 'pending'),
+                'status_url': f'/webhook/solution-status/{order_id}'
+            }, 202
+        _webhook_inflight.add(order_id)
+
     # Update status
     webhook_solution_status[order_id] = {
         'status': 'solving',
@@ -1591,7 +2300,7 @@ def receive_problem_webhook():
     }
     
     # Store problem for solving
-    normalized_hash = '0x' + problem_hash.lower().replace('0x', '')
+    normalized_hash = _norm_hash(problem_hash)
     problem_type_label = (data.get('problem_type_label') or data.get('problemTypeLabel') or '').strip() or None
     skill_instructions = (data.get('skill_instructions') or data.get('skillInstructions') or '').strip() or None
     problem_storage[normalized_hash] = {
@@ -1601,8 +2310,8 @@ def receive_problem_webhook():
         'skill_instructions': skill_instructions,
         'timestamp': datetime.now().isoformat()
     }
-    save_problem_storage()
-    
+    save_problem_storage(normalized_hash)
+
     # Solve the problem immediately
     try:
         solution_data = solve_problem(problem_type, normalized_hash, problem_text, problem_type_label, skill_instructions)
@@ -1625,113 +2334,96 @@ def receive_problem_webhook():
             'solved_at': datetime.now().isoformat()
         }
         
-        # Submit to chain synchronously (PythonAnywhere doesn't support background threads well)
         logger.info(f"[WEBHOOK] submit_to_chain={submit_to_chain} (type={type(submit_to_chain).__name__})")
-        
+
         if submit_to_chain:
-            logger.info(f"[WEBHOOK] Initializing SDK...")
-            sdk = init_sdk_if_needed()
-            if not sdk:
-                logger.error(f"[WEBHOOK] SDK initialization failed!")
-                result['chain_error'] = 'SDK not available'
-                webhook_solution_status[order_id]['status'] = 'sdk_failed'
-                return jsonify(result)
-            logger.info(f"[WEBHOOK] SDK ready: {sdk.address}")
-            
-            try:
-                # Generate salt for commit-reveal
-                salt = os.urandom(32)
-                webhook_solution_status[order_id]['salt'] = salt.hex()
-                
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                try:
-                    # First check order status and accept if needed
-                    order = loop.run_until_complete(sdk.get_order(order_id))
-                    logger.info(f"[WEBHOOK] Order #{order_id} status: {order.status.name}")
-                    
-                    if order.status.name in ['POSTED', 'ASSIGNED', 'OPEN']:
-                        # Need to accept the order first
-                        webhook_solution_status[order_id]['status'] = 'accepting'
-                        logger.info(f"[WEBHOOK] Accepting order #{order_id}...")
-                        
-                        accept_receipt = loop.run_until_complete(
-                            sdk.accept_order(order_id)
-                        )
-                        logger.info(f"[WEBHOOK] Accept TX: {accept_receipt.tx_hash}, success={accept_receipt.success}")
-                        
-                        if not accept_receipt.success:
-                            # Wait and check if it succeeded anyway
-                            loop.run_until_complete(asyncio.sleep(2))
-                            order = loop.run_until_complete(sdk.get_order(order_id))
-                            if order.status.name != 'ACCEPTED':
-                                result['chain_error'] = f'Accept failed, status={order.status.name}'
-                                webhook_solution_status[order_id]['status'] = 'accept_failed'
-                                loop.close()
-                                return jsonify(result)
-                        
-                        # Wait for accept to propagate
-                        loop.run_until_complete(asyncio.sleep(2))
-                    
-                    # Commit solution
-                    webhook_solution_status[order_id]['status'] = 'committing'
-                    logger.info(f"[WEBHOOK] Committing solution for #{order_id}...")
-                    
-                    commit_receipt = loop.run_until_complete(
-                        sdk.commit_solution(order_id, solution, salt)
-                    )
-                    result['commit_tx'] = commit_receipt.tx_hash
-                    webhook_solution_status[order_id]['commit_tx'] = commit_receipt.tx_hash
-                    logger.info(f"[WEBHOOK] Commit TX: {commit_receipt.tx_hash}")
-                    
-                    # Wait for commit to propagate
-                    logger.info(f"[WEBHOOK] Waiting 3s before reveal...")
-                    loop.run_until_complete(asyncio.sleep(3))
-                    
-                    # Reveal solution
-                    webhook_solution_status[order_id]['status'] = 'revealing'
-                    logger.info(f"[WEBHOOK] Revealing solution for #{order_id}...")
-                    
-                    reveal_receipt = loop.run_until_complete(
-                        sdk.reveal_solution(order_id, solution, salt)
-                    )
-                    result['reveal_tx'] = reveal_receipt.tx_hash
-                    webhook_solution_status[order_id]['reveal_tx'] = reveal_receipt.tx_hash
-                    logger.info(f"[WEBHOOK] Reveal TX: {reveal_receipt.tx_hash}")
-                    
-                    if reveal_receipt.success:
-                        webhook_solution_status[order_id]['status'] = 'completed'
-                        logger.info(f"[WEBHOOK] Order #{order_id} COMPLETED!")
-                        bot_state.stats['orders_solved'] += 1
-                    else:
-                        webhook_solution_status[order_id]['status'] = 'reveal_failed'
-                        result['chain_error'] = 'Reveal may have failed'
-                        logger.error(f"[WEBHOOK] Reveal may have failed for #{order_id}")
-                finally:
-                    loop.close()
-                    
-            except Exception as e:
-                logger.error(f"[WEBHOOK] Chain submission error: {e}")
-                import traceback
-                logger.error(f"[WEBHOOK] Traceback: {traceback.format_exc()}")
-                result['chain_error'] = str(e)
-                webhook_solution_status[order_id]['status'] = 'chain_error'
-                webhook_solution_status[order_id]['error'] = str(e)
+            # Generate salt for commit-reveal and hand off to the worker;
+            # the commit/reveal sequence waits on block confirmations and
+            # would otherwise pin this Flask worker for ~10s
+            salt = secrets.token_bytes(32)
+            webhook_solution_status[order_id]['salt'] = salt.hex()
+            webhook_solution_status[order_id]['status'] = 'queued'
+            _chain_job_queue.put((order_id, solution, salt))
+
+            result['status'] = 'queued'
+            result['status_url'] = f'/webhook/solution-status/{order_id}'
+            logger.info(f"[WEBHOOK] Queued chain submission for #{order_id}")
+            return result, 202
         else:
             logger.info(f"[WEBHOOK] submit_to_chain is False, skipping chain submission")
-        
+
+        # No chain job queued, so this request owns the release
+        _release_webhook_inflight(order_id)
         logger.info(f"[WEBHOOK] Returning result for #{order_id}")
-        return jsonify(result)
-        
+        return result, 200
+
     except Exception as e:
         logger.error(f"[WEBHOOK] Error solving #{order_id}: {e}")
         webhook_solution_status[order_id]['status'] = 'error'
         webhook_solution_status[order_id]['error'] = str(e)
-        return jsonify({
+        _release_webhook_inflight(order_id)
+        return {
             'success': False,
             'error': str(e)
-        })
+        }, 200
+
+
+@app.route('/webhook/problem', methods=['POST'])
+def receive_problem_webhook():
+    """
+    Receive problem push from platform (Webhook mode).
+    Platform calls this when a user selects this bot.
+
+    Immediately solves the problem; chain submission (commit + reveal)
+    is queued to a background worker so the response doesn't wait on
+    block confirmations.
+
+    Request body:
+        - order_id: int (required)
+        - problem_hash: str
+        - problem_text: str (required)
+        - problem_type: int
+        - submit_to_chain: bool (default: true)
+
+    Returns (202 when queued):
+        - success: bool
+        - solution: str
+        - steps: list
+        - status_url: str (poll for commit/reveal progress)
+    """
+    payload, status = _handle_problem_webhook(_json_body())
+    return ojsonify(payload), status
+
+
+@app.route('/webhook/problem_bin', methods=['POST'])
+def receive_problem_webhook_bin():
+    """
+    MessagePack twin of /webhook/problem for internal callers.
+
+    Numeric fields skip string parsing entirely and problem_hash may be
+    sent as raw 32 bytes instead of a hex string, roughly halving that
+    field on the wire. External clients should keep using the JSON route.
+    """
+    if msgpack is None:
+        return ojsonify({'success': False,
+                         'error': 'msgpack not installed on this server'}), 501
+
+    try:
+        data = msgpack.unpackb(request.get_data(cache=False), raw=False)
+    except Exception:
+        data = None
+    if not isinstance(data, dict):
+        data = {}
+
+    # Raw-binary hashes get normalized to the hex form the storage keys use
+    raw_hash = data.get('problem_hash')
+    if isinstance(raw_hash, (bytes, bytearray)):
+        data['problem_hash'] = raw_hash.hex()
+
+    payload, status = _handle_problem_webhook(data)
+    return app.response_class(msgpack.packb(payload, use_bin_type=True),
+                              mimetype='application/msgpack',
+                              direct_passthrough=True), status
 
 
 @app.route('/webhook/status', methods=['GET'])
@@ -1755,6 +2447,7 @@ def get_webhook_solution_status(order_id):
         - pending: Not started
         - solving: GPT is working on the problem
         - solved: Solution found, not yet submitted
+        - queued: Waiting for the chain submission worker
         - committing: Submitting commit transaction
         - revealing: Submitting reveal transaction
         - completed: Successfully submitted to chain
@@ -1767,7 +2460,7 @@ def get_webhook_solution_status(order_id):
         # Check if solution exists in storage (may have been solved by polling bot)
         order_key = str(order_id)
         if order_key in solution_storage:
-            return jsonify({
+            return ojsonify({
                 'success': True,
                 'order_id': order_id,
                 'status': 'completed',
@@ -1782,7 +2475,7 @@ def get_webhook_solution_status(order_id):
         })
     
     status_info = webhook_solution_status[order_id]
-    return jsonify({
+    return ojsonify({
         'success': True,
         'order_id': order_id,
         'status': status_info.get('status', 'unknown'),
@@ -1801,19 +2494,53 @@ def load_bot_registration():
     """Load bot registration data"""
     if os.path.exists(BOT_REGISTRATION_FILE):
         try:
-            with open(BOT_REGISTRATION_FILE, 'r') as f:
-                return json.load(f)
+            with open(BOT_REGISTRATION_FILE, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             logger.error(f"Failed to load bot registration: {e}")
     return {}
 
+# Registration writes are debounced onto one background thread: the
+# endpoint returns once the in-memory dict is updated, and bursts of
+# profile edits coalesce into a single atomic rewrite
+_registration_write_queue = queue.Queue(maxsize=1)
+
+
+def _registration_writer():
+    while True:
+        data = _registration_write_queue.get()
+        time.sleep(0.25)
+        # Drain anything queued during the debounce window; last one wins
+        while True:
+            try:
+                data = _registration_write_queue.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            tmp = BOT_REGISTRATION_FILE + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp, BOT_REGISTRATION_FILE)
+        except Exception as e:
+            logger.error(f"Failed to save bot registration: {e}")
+
+
+threading.Thread(target=_registration_writer, daemon=True).start()
+
+
 def save_bot_registration(data):
-    """Save bot registration data"""
-    try:
-        with open(BOT_REGISTRATION_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-    except Exception as e:
-        logger.error(f"Failed to save bot registration: {e}")
+    """Queue a registration write; newest snapshot wins"""
+    snapshot = dict(data)
+    while True:
+        try:
+            _registration_write_queue.put_nowait(snapshot)
+            return
+        except queue.Full:
+            # Displace the stale pending snapshot with this one
+            try:
+                _registration_write_queue.get_nowait()
+            except queue.Empty:
+                pass
 
 bot_registration = load_bot_registration()
 
@@ -1830,8 +2557,8 @@ def register_bot():
         - is_premium: bool
         - supported_types: list[int]
     """
-    data = request.get_json() or {}
-    
+    data = _json_body()
+
     name = data.get('name', 'Ominis Bot')
     description = data.get('description', 'AI-powered calculus solver')
     webhook_url = data.get('webhook_url', '')
@@ -1887,8 +2614,8 @@ def get_bot_profile():
 @app.route('/bot/profile', methods=['PUT'])
 def update_bot_profile():
     """Update bot profile"""
-    data = request.get_json() or {}
-    
+    data = _json_body()
+
     if 'name' in data:
         bot_registration['name'] = data['name']
     if 'description' in data:
@@ -1914,9 +2641,10 @@ def update_bot_profile():
 @app.route('/bot/stats', methods=['GET'])
 def get_bot_stats():
     """Get bot statistics"""
+    # Both O(1): dict size plus the incrementally maintained tally
     total_solved = len(solution_storage)
-    verified_count = sum(1 for s in solution_storage.values() if s.get('verified', False))
-    
+    verified_count = _verified_count
+
     return jsonify({
         'success': True,
         'stats': {
@@ -1945,4 +2673,20 @@ if __name__ == '__main__':
     print("=" * 50)
     
     port = int(os.getenv('PORT', 5001))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    # Handlers are I/O-bound (RPC calls, OpenAI, sqlite), so the thread
+    # count — not the core count — is the concurrency knob that matters.
+    threads = int(os.getenv('BOT_SERVER_THREADS', 16))
+    try:
+        # Production WSGI server: fixed thread pool plus HTTP keep-alive,
+        # so the frontend's poll loop reuses connections instead of paying
+        # TCP setup per request. Single process on purpose — bot_state,
+        # auto_solver, the in-flight trackers and the bot event loop are
+        # per-process, so multi-worker serving (gunicorn -w N) would run
+        # N competing auto-solvers and double-submit orders.
+        from waitress import serve
+        print(f"Serving with waitress on port {port} ({threads} threads)")
+        serve(app, host='0.0.0.0', port=port, threads=threads)
+    except ImportError:
+        # Dev fallback; threaded=True so long handlers (webhook solve +
+        # chain submission) don't stall /status and /logs polling
+        app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
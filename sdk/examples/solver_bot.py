@@ -21,6 +21,9 @@ import os
 import sys
 import asyncio
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 from dotenv import load_dotenv
@@ -70,6 +73,10 @@ class BotConfig:
     # Polling interval for new orders (seconds)
     POLL_INTERVAL: float = 2.0
 
+    # Interval for the full get_open_orders reconciliation pass (seconds);
+    # between passes only new ProblemPosted events are fetched
+    RECONCILE_INTERVAL: float = 60.0
+
 
 # ========== AI/CAS Solver Integration ==========
 
@@ -99,6 +106,82 @@ except ImportError:
     logger.warning("OpenAI not installed. AI solving disabled. Install with: pip install openai")
 
 
+if SYMPY_AVAILABLE:
+    # Module level so the caches are shared across solver instances.
+    # symbols('x') always returns the same object for the same name, so
+    # these interoperate with the per-instance self.x below.
+    _X = symbols('x')
+
+    _TRANSFORMATIONS = (
+        standard_transformations +
+        (implicit_multiplication_application, convert_xor)
+    )
+
+    @lru_cache(maxsize=4096)
+    def _parse(expression: str):
+        """Memoized parse_expr: the tokenizer + transformation pipeline is
+        slow Python, and the same expressions recur across orders."""
+        return parse_expr(expression, transformations=_TRANSFORMATIONS)
+
+    @lru_cache(maxsize=2048)
+    def _sympy_solution(expression: str, problem_type: "ProblemType") -> str:
+        """Solve one expression; repeat (expression, type) pairs become a
+        dict lookup. Failures raise and are deliberately not cached."""
+        expr = _parse(expression)
+
+        if problem_type == ProblemType.DERIVATIVE:
+            # Compute derivative
+            result = diff(expr, _X)
+            return f"d/dx [{expression}] = {simplify(result)}"
+
+        elif problem_type == ProblemType.INTEGRAL:
+            # Compute indefinite integral
+            result = integrate(expr, _X)
+            return f"∫({expression})dx = {simplify(result)} + C"
+
+        elif problem_type == ProblemType.LIMIT:
+            # Compute limit as x -> 0 (default)
+            result = limit(expr, _X, 0)
+            return f"lim(x→0) [{expression}] = {result}"
+
+        elif problem_type == ProblemType.DIFFERENTIAL_EQ:
+            # Solve ODE: parse as y' = f(x, y)
+            y = Function('y')
+            # Try to parse as simple ODE
+            ode = Eq(y(_X).diff(_X), expr)
+            result = dsolve(ode, y(_X))
+            return f"Solution: {result}"
+
+        elif problem_type == ProblemType.SERIES:
+            # Compute Taylor series around x=0, 6 terms
+            result = series(expr, _X, 0, 6)
+            return f"Series expansion: {result}"
+
+        else:
+            # Unknown type, try to simplify
+            result = simplify(expr)
+            return f"Simplified: {result}"
+
+    def _verify_sympy(problem_type: "ProblemType", expression: str,
+                      solution: str) -> bool:
+        """Top-level (picklable) verification worker for the CPU pool."""
+        expr = _parse(expression)
+        sol = _parse(solution)
+
+        if problem_type == ProblemType.DERIVATIVE:
+            # Verify: d/dx(antiderivative) = original
+            expected = diff(expr, _X)
+            return simplify(expected - sol) == 0
+
+        elif problem_type == ProblemType.INTEGRAL:
+            # Verify: d/dx(solution) = original
+            derivative = diff(sol, _X)
+            return simplify(derivative - expr) == 0
+
+        # For other types, trust the solution
+        return True
+
+
 class MathSolver:
     """
     Math problem solver using SymPy (local CAS) and OpenAI GPT-4 (AI).
@@ -136,11 +219,12 @@ class MathSolver:
         self.x = symbols('x') if SYMPY_AVAILABLE else None
         self.y = symbols('y') if SYMPY_AVAILABLE else None
         
-        # Parser transformations for flexible input
-        self.transformations = (
-            standard_transformations + 
-            (implicit_multiplication_application, convert_xor)
-        ) if SYMPY_AVAILABLE else None
+        # Parser transformations for flexible input (built once at module level)
+        self.transformations = _TRANSFORMATIONS if SYMPY_AVAILABLE else None
+
+        # SymPy holds the GIL for long stretches; run it off the event loop
+        # in worker processes so polling and RPC calls stay responsive
+        self._cpu_pool = ProcessPoolExecutor(max_workers=2) if SYMPY_AVAILABLE else None
     
     async def solve(self, problem_hash: bytes, problem_type: ProblemType, 
                     expression: Optional[str] = None) -> Optional[str]:
@@ -210,44 +294,12 @@ class MathSolver:
         """
         if not SYMPY_AVAILABLE:
             return None
-        
+
         try:
-            # Parse the expression
-            expr = parse_expr(expression, transformations=self.transformations)
-            
-            if problem_type == ProblemType.DERIVATIVE:
-                # Compute derivative
-                result = diff(expr, self.x)
-                return f"d/dx [{expression}] = {simplify(result)}"
-            
-            elif problem_type == ProblemType.INTEGRAL:
-                # Compute indefinite integral
-                result = integrate(expr, self.x)
-                return f"∫({expression})dx = {simplify(result)} + C"
-            
-            elif problem_type == ProblemType.LIMIT:
-                # Compute limit as x -> 0 (default)
-                result = limit(expr, self.x, 0)
-                return f"lim(x→0) [{expression}] = {result}"
-            
-            elif problem_type == ProblemType.DIFFERENTIAL_EQ:
-                # Solve ODE: parse as y' = f(x, y)
-                y = Function('y')
-                # Try to parse as simple ODE
-                ode = Eq(y(self.x).diff(self.x), expr)
-                result = dsolve(ode, y(self.x))
-                return f"Solution: {result}"
-            
-            elif problem_type == ProblemType.SERIES:
-                # Compute Taylor series around x=0, 6 terms
-                result = series(expr, self.x, 0, 6)
-                return f"Series expansion: {result}"
-            
-            else:
-                # Unknown type, try to simplify
-                result = simplify(expr)
-                return f"Simplified: {result}"
-                
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._cpu_pool, _sympy_solution, expression, problem_type
+            )
         except Exception as e:
             logger.warning(f"SymPy solving failed: {e}")
             return None
@@ -321,22 +373,10 @@ class MathSolver:
             return True  # Cannot verify without SymPy
         
         try:
-            expr = parse_expr(expression, transformations=self.transformations)
-            sol = parse_expr(solution, transformations=self.transformations)
-            
-            if problem_type == ProblemType.DERIVATIVE:
-                # Verify: d/dx(antiderivative) = original
-                expected = diff(expr, self.x)
-                return simplify(expected - sol) == 0
-            
-            elif problem_type == ProblemType.INTEGRAL:
-                # Verify: d/dx(solution) = original
-                derivative = diff(sol, self.x)
-                return simplify(derivative - expr) == 0
-            
-            # For other types, trust the solution
-            return True
-            
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._cpu_pool, _verify_sympy, problem_type, expression, solution
+            )
         except Exception:
             return True  # Cannot verify, assume correct
 
@@ -361,6 +401,15 @@ class SolverBot:
         self.solver = MathSolver()
         self.active_orders: dict[int, Order] = {}
         self.running = False
+        # Event-scan high-watermark and reconciliation clock
+        self._last_scanned_block = 0
+        self._last_reconcile = 0.0
+        # Hoisted once: _should_accept checks these per order per poll
+        self._supported_types = frozenset(config.SUPPORTED_TYPES)
+        self._accepted_tiers = frozenset(config.ACCEPTED_TIERS)
+        # Profit estimates barely move between polls, so cache them per
+        # order with a short TTL: {order_id: (profit, expiry_ts)}
+        self._profit_cache = {}
     
     async def start(self):
         """Start the solver bot"""
@@ -380,57 +429,118 @@ class SolverBot:
         logger.info("Stopping solver bot...")
         self.running = False
     
+    def _new_order_ids_from_events(self) -> list[int]:
+        """Order ids announced by ProblemPosted since the last scan.
+
+        Incremental eth_getLogs from the high-watermark: the steady-state
+        poll fetches only the delta instead of re-listing (and
+        re-filtering) the same 50 open orders every two seconds.
+        """
+        head = self.sdk.w3.eth.block_number
+        if self._last_scanned_block == 0:
+            # First scan: start at the current head
+            self._last_scanned_block = head
+        if head <= self._last_scanned_block:
+            return []
+
+        # camelCase kwargs: the repo pins web3 v6 (v7 renamed these)
+        events = self.sdk.core.events.ProblemPosted.get_logs(
+            fromBlock=self._last_scanned_block + 1,
+            toBlock=head
+        )
+        self._last_scanned_block = head
+        return [event['args']['orderId'] for event in events]
+
     async def _main_loop(self):
-        """Main event loop"""
+        """Main event loop: event-driven with periodic reconciliation"""
         while self.running:
             try:
-                # Get open orders
-                orders = await self.sdk.get_open_orders(limit=50)
-                logger.debug(f"Found {len(orders)} open orders")
-                
+                now = time.monotonic()
+                if now - self._last_reconcile >= self.config.RECONCILE_INTERVAL:
+                    # Full re-list catches anything the event scan missed
+                    # (e.g. orders posted before the bot started)
+                    orders = await self.sdk.get_open_orders(limit=50)
+                    self._last_reconcile = now
+                else:
+                    order_ids = self._new_order_ids_from_events()
+                    fetched = await asyncio.gather(
+                        *(self.sdk.get_order(oid) for oid in order_ids),
+                        return_exceptions=True
+                    )
+                    orders = [o for o in fetched if isinstance(o, Order)]
+                logger.debug(f"Found {len(orders)} candidate orders")
+
+                self._sweep_profit_cache(now)
                 for order in orders:
-                    if await self._should_accept(order):
+                    if self._should_accept(order):
                         await self._handle_order(order)
-                
+
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
-            
+
             await asyncio.sleep(self.config.POLL_INTERVAL)
     
-    async def _should_accept(self, order: Order) -> bool:
-        """Determine if bot should accept an order"""
-        
+    def _should_accept(self, order: Order) -> bool:
+        """Determine if bot should accept an order.
+
+        Plain synchronous checks, cheapest first: set membership and
+        integer comparisons reject most orders before the profit
+        estimate (the only check that does real arithmetic) runs.
+        """
         # Check if already handling
         if order.id in self.active_orders:
             return False
-        
+
         # Check concurrent limit
         if len(self.active_orders) >= self.config.MAX_CONCURRENT_ORDERS:
             return False
-        
+
         # Check problem type
-        if order.problem_type not in self.config.SUPPORTED_TYPES:
+        if order.problem_type not in self._supported_types:
             logger.debug(f"Order {order.id}: Unsupported type {order.problem_type.name}")
             return False
-        
+
         # Check time tier
-        if order.time_tier not in self.config.ACCEPTED_TIERS:
+        if order.time_tier not in self._accepted_tiers:
             logger.debug(f"Order {order.id}: Time tier {order.time_tier.name} not accepted")
             return False
-        
-        # Check profitability
-        profit = self.sdk.estimate_profit(order)
-        if profit < self.config.MIN_PROFIT_USDC:
-            logger.debug(f"Order {order.id}: Profit ${profit:.4f} below threshold")
-            return False
-        
+
         # Check time remaining
         if order.time_remaining < 30:  # Need at least 30 seconds
             logger.debug(f"Order {order.id}: Not enough time remaining")
             return False
-        
+
+        # Check profitability
+        profit = self._cached_profit(order)
+        if profit < self.config.MIN_PROFIT_USDC:
+            logger.debug(f"Order {order.id}: Profit ${profit:.4f} below threshold")
+            return False
+
         return True
-    
+
+    PROFIT_CACHE_TTL = 10.0  # seconds; gas/reward inputs barely move faster
+
+    def _cached_profit(self, order: Order) -> float:
+        """estimate_profit with a short per-order TTL cache.
+
+        Open orders are re-evaluated every POLL_INTERVAL until accepted
+        or expired; without the cache each pass repeats the same gas and
+        reward arithmetic for every order.
+        """
+        cached = self._profit_cache.get(order.id)
+        now = time.monotonic()
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        profit = self.sdk.estimate_profit(order)
+        self._profit_cache[order.id] = (profit, now + self.PROFIT_CACHE_TTL)
+        return profit
+
+    def _sweep_profit_cache(self, now: float):
+        """Drop expired entries so the cache tracks open orders, not history"""
+        expired = [oid for oid, (_, exp) in self._profit_cache.items() if exp <= now]
+        for oid in expired:
+            del self._profit_cache[oid]
+
     async def _handle_order(self, order: Order):
         """Handle a single order (accept, solve, submit)"""
         order_id = order.id
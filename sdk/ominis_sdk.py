@@ -475,17 +475,67 @@ class OminisSDK:
             Tuple of (commit_receipt, reveal_receipt)
         """
         salt = os.urandom(32)
-        
+
         commit_receipt = await self.commit_solution(order_id, solution, salt)
         if not commit_receipt.success:
             raise Exception(f"Commit failed: {commit_receipt.tx_hash}")
-        
+
         # Wait a bit for commit to be mined
         await asyncio.sleep(2)
-        
+
         reveal_receipt = await self.reveal_solution(order_id, solution, salt)
         return commit_receipt, reveal_receipt
-    
+
+    async def submit_solution_pipelined(self, order_id: int, solution: str, salt: bytes) -> tuple[TxReceipt, TxReceipt]:
+        """
+        Broadcast commit + reveal back-to-back with consecutive nonces.
+
+        Both transactions are signed and sent immediately; only the reveal
+        receipt is awaited. Sequential nonces guarantee the commit executes
+        before the reveal (same block or earlier), so the pair costs one
+        block-wait instead of two plus a sleep.
+
+        If the contract rejects a same-block reveal, the reveal receipt
+        comes back failed while the commit still lands — callers can
+        retry reveal_solution on its own in that case.
+
+        Args:
+            order_id: The order ID
+            solution: The solution string
+            salt: 32 bytes of random salt (same salt for both steps)
+
+        Returns:
+            Tuple of (commit_receipt, reveal_receipt)
+        """
+        commit_hash = self.compute_commit_hash(solution, salt)
+        nonce = self.w3.eth.get_transaction_count(self.address, 'pending')
+        gas_price = self._get_gas_price()
+
+        commit_tx = self.core.functions.commitSolution(order_id, commit_hash).build_transaction({
+            'from': self.address,
+            'nonce': nonce,
+            'gas': 250000,
+            'gasPrice': gas_price
+        })
+        reveal_tx = self.core.functions.revealSolution(order_id, solution, salt).build_transaction({
+            'from': self.address,
+            'nonce': nonce + 1,
+            'gas': 500000,
+            'gasPrice': gas_price
+        })
+
+        commit_tx_hash = self.w3.eth.send_raw_transaction(
+            self.account.sign_transaction(commit_tx).raw_transaction
+        )
+        reveal_tx_hash = self.w3.eth.send_raw_transaction(
+            self.account.sign_transaction(reveal_tx).raw_transaction
+        )
+
+        reveal_receipt = await self._wait_receipt(reveal_tx_hash)
+        # The commit mined at or before the reveal, so this resolves fast
+        commit_receipt = await self._wait_receipt(commit_tx_hash, timeout=30)
+        return commit_receipt, reveal_receipt
+
     # ========== Event Listening ==========
     
     async def listen_new_orders(self, poll_interval: float = 2.0) -> AsyncIterator[Order]:
@@ -839,14 +889,21 @@ class OminisSDK:
         """Sign and send a transaction"""
         import logging
         logger = logging.getLogger(__name__)
-        
+
         signed = self.account.sign_transaction(tx)
         tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
         logger.info(f"Transaction sent: {tx_hash.hex()}")
-        
+
+        return await self._wait_receipt(tx_hash)
+
+    async def _wait_receipt(self, tx_hash, timeout: float = 120) -> TxReceipt:
+        """Wait for a transaction receipt, returning a failed TxReceipt on timeout"""
+        import logging
+        logger = logging.getLogger(__name__)
+
         # Wait with timeout
         try:
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
             logger.info(f"Receipt received: status={receipt.status}, gasUsed={receipt.gasUsed}")
         except Exception as e:
             logger.error(f"Transaction timeout or error: {e}")
@@ -857,10 +914,10 @@ class OminisSDK:
                 gas_used=0,
                 status=False
             )
-        
+
         success = receipt.status == 1
         logger.info(f"Transaction result: success={success}")
-        
+
         return TxReceipt(
             tx_hash=receipt.transactionHash.hex(),
             block_number=receipt.blockNumber,